@@ -0,0 +1,52 @@
+-- Migration: 20261016_001_entities_unique_type_name
+-- Description: Unique (entity_type, name) index so _ensure_entity can use a
+--              single UPSERT (ON CONFLICT DO NOTHING) instead of SELECT + INSERT
+-- Author: A2I2 Team
+-- Date: 2026-10-16
+-- Rollback: DROP INDEX IF EXISTS idx_entities_type_name_unique;
+
+-- ============================================
+-- UP Migration
+-- ============================================
+
+-- Collapse any duplicates first. Keep the oldest row per entity_type/name
+-- (lowest id on created_at ties), repoint relationships at it, then delete
+-- the rest; relationships cascade on entity delete, so repoint before deleting.
+CREATE TEMP TABLE _entity_dupes AS
+SELECT id, keep_id
+FROM (
+    SELECT
+        id,
+        first_value(id) OVER w AS keep_id,
+        row_number() OVER w AS rn
+    FROM arcus_entities
+    WINDOW w AS (PARTITION BY entity_type, name ORDER BY created_at, id)
+) ranked
+WHERE rn > 1;
+
+UPDATE arcus_relationships r
+SET source_entity_id = d.keep_id
+FROM _entity_dupes d
+WHERE r.source_entity_id = d.id;
+
+UPDATE arcus_relationships r
+SET target_entity_id = d.keep_id
+FROM _entity_dupes d
+WHERE r.target_entity_id = d.id;
+
+DELETE FROM arcus_entities e
+USING _entity_dupes d
+WHERE e.id = d.id;
+
+DROP TABLE _entity_dupes;
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_entities_type_name_unique
+    ON arcus_entities(entity_type, name);
+
+-- ============================================
+-- Record migration (do not modify)
+-- ============================================
+
+INSERT INTO arcus_schema_migrations (version, description, applied_by)
+VALUES ('20261016_001', 'entities_unique_type_name', current_user)
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,70 @@
+-- Migration: 20261016_002_hnsw_match_memory
+-- Description: Switch memory embedding indexes from IVFFlat to HNSW and add
+--              the match_memory() RPC used for vector recall
+-- Author: A2I2 Team
+-- Date: 2026-10-16
+-- Rollback: DROP FUNCTION IF EXISTS match_memory(VECTOR, TEXT, INTEGER, FLOAT, TIMESTAMPTZ);
+--           DROP the idx_*_embedding HNSW indexes and recreate them with
+--           USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100)
+
+-- ============================================
+-- UP Migration
+-- ============================================
+
+-- HNSW gives better recall than IVFFlat without periodic re-training and
+-- does not degrade as rows are added after index creation
+DROP INDEX IF EXISTS idx_episodic_embedding;
+DROP INDEX IF EXISTS idx_semantic_embedding;
+DROP INDEX IF EXISTS idx_procedural_embedding;
+
+CREATE INDEX IF NOT EXISTS idx_episodic_embedding ON arcus_episodic_memory
+    USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64);
+
+CREATE INDEX IF NOT EXISTS idx_semantic_embedding ON arcus_semantic_memory
+    USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64);
+
+CREATE INDEX IF NOT EXISTS idx_procedural_embedding ON arcus_procedural_memory
+    USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64);
+
+-- Function: Nearest-neighbour recall over a single memory table
+-- Returns full rows (minus the embedding) ordered by cosine distance so the
+-- HNSW index drives the scan. Used by KnowledgeRepository.recall().
+CREATE OR REPLACE FUNCTION match_memory(
+    query_embedding VECTOR(1536),
+    table_name TEXT,
+    match_count INTEGER DEFAULT 10,
+    min_confidence FLOAT DEFAULT 0.0,
+    created_after TIMESTAMPTZ DEFAULT NULL
+)
+RETURNS SETOF JSONB AS $$
+BEGIN
+    IF table_name NOT IN (
+        'arcus_episodic_memory',
+        'arcus_semantic_memory',
+        'arcus_procedural_memory'
+    ) THEN
+        RAISE EXCEPTION 'match_memory: unsupported table %', table_name;
+    END IF;
+
+    RETURN QUERY EXECUTE format(
+        'SELECT (to_jsonb(t) - ''embedding'')
+                || jsonb_build_object(''similarity'', 1 - (t.embedding <=> $1))
+         FROM %I t
+         WHERE t.embedding IS NOT NULL
+           AND t.confidence >= $2
+           AND ($3::TIMESTAMPTZ IS NULL OR t.created_at >= $3)
+         ORDER BY t.embedding <=> $1
+         LIMIT $4',
+        table_name
+    )
+    USING query_embedding, min_confidence, created_after, match_count;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================
+-- Record migration (do not modify)
+-- ============================================
+
+INSERT INTO arcus_schema_migrations (version, description, applied_by)
+VALUES ('20261016_002', 'hnsw_match_memory', current_user)
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,83 @@
+-- Migration: 20261016_003_fulltext_search_memory
+-- Description: Add generated tsvector columns with GIN indexes to the memory
+--              tables and the search_memory() RPC for lexical recall
+-- Author: A2I2 Team
+-- Date: 2026-10-16
+-- Rollback: DROP FUNCTION IF EXISTS search_memory(TEXT, TEXT, INTEGER, FLOAT, TIMESTAMPTZ);
+--           DROP INDEX IF EXISTS idx_{episodic,semantic,procedural}_search_doc;
+--           ALTER TABLE arcus_{episodic,semantic,procedural}_memory DROP COLUMN IF EXISTS search_doc;
+
+-- ============================================
+-- UP Migration
+-- ============================================
+
+-- Generated tsvector columns + GIN indexes for lexical recall
+ALTER TABLE arcus_episodic_memory ADD COLUMN IF NOT EXISTS search_doc TSVECTOR
+    GENERATED ALWAYS AS (
+        to_tsvector('english', coalesce(summary, '') || ' ' || coalesce(outcome, ''))
+    ) STORED;
+
+ALTER TABLE arcus_semantic_memory ADD COLUMN IF NOT EXISTS search_doc TSVECTOR
+    GENERATED ALWAYS AS (
+        to_tsvector('english', coalesce(statement, '') || ' ' || coalesce(domain, ''))
+    ) STORED;
+
+ALTER TABLE arcus_procedural_memory ADD COLUMN IF NOT EXISTS search_doc TSVECTOR
+    GENERATED ALWAYS AS (
+        to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, ''))
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_episodic_search_doc ON arcus_episodic_memory USING GIN(search_doc);
+CREATE INDEX IF NOT EXISTS idx_semantic_search_doc ON arcus_semantic_memory USING GIN(search_doc);
+CREATE INDEX IF NOT EXISTS idx_procedural_search_doc ON arcus_procedural_memory USING GIN(search_doc);
+
+-- Function: Lexical recall over a single memory table
+-- Terms are OR-ed (any term matches) and ranked with ts_rank, so a whole
+-- conversational message still finds rows mentioning any of its keywords.
+-- Used by KnowledgeRepository.recall() when no embedding is available.
+CREATE OR REPLACE FUNCTION search_memory(
+    q TEXT,
+    table_name TEXT,
+    match_count INTEGER DEFAULT 10,
+    min_confidence FLOAT DEFAULT 0.0,
+    created_after TIMESTAMPTZ DEFAULT NULL
+)
+RETURNS SETOF JSONB AS $$
+DECLARE
+    tsq TSQUERY;
+BEGIN
+    IF table_name NOT IN (
+        'arcus_episodic_memory',
+        'arcus_semantic_memory',
+        'arcus_procedural_memory'
+    ) THEN
+        RAISE EXCEPTION 'search_memory: unsupported table %', table_name;
+    END IF;
+
+    tsq := NULLIF(replace(plainto_tsquery('english', q)::TEXT, ' & ', ' | '), '')::TSQUERY;
+    IF tsq IS NULL THEN
+        RETURN;
+    END IF;
+
+    RETURN QUERY EXECUTE format(
+        'SELECT (to_jsonb(t) - ''embedding'' - ''search_doc'')
+                || jsonb_build_object(''rank'', ts_rank(t.search_doc, $1))
+         FROM %I t
+         WHERE t.search_doc @@ $1
+           AND t.confidence >= $2
+           AND ($3::TIMESTAMPTZ IS NULL OR t.created_at >= $3)
+         ORDER BY ts_rank(t.search_doc, $1) DESC
+         LIMIT $4',
+        table_name
+    )
+    USING tsq, min_confidence, created_after, match_count;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================
+-- Record migration (do not modify)
+-- ============================================
+
+INSERT INTO arcus_schema_migrations (version, description, applied_by)
+VALUES ('20261016_003', 'fulltext_search_memory', current_user)
+ON CONFLICT (version) DO NOTHING;
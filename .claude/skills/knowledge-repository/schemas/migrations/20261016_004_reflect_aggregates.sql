@@ -0,0 +1,43 @@
+-- Migration: 20261016_004_reflect_aggregates
+-- Description: Server-side aggregation RPCs for REFLECT so it no longer
+--              downloads event/preference rows just to count them
+-- Author: A2I2 Team
+-- Date: 2026-10-16
+-- Rollback: DROP FUNCTION IF EXISTS reflect_event_counts(INTEGER, FLOAT);
+--           DROP FUNCTION IF EXISTS reflect_preference_count();
+
+-- ============================================
+-- UP Migration
+-- ============================================
+
+-- Function: Event counts by type for REFLECT (aggregated server-side)
+CREATE OR REPLACE FUNCTION reflect_event_counts(
+    p_days INTEGER,
+    p_min_confidence FLOAT DEFAULT 0.5
+)
+RETURNS TABLE (
+    event_type TEXT,
+    event_count BIGINT
+) AS $$
+    SELECT em.event_type, COUNT(*) AS event_count
+    FROM arcus_episodic_memory em
+    WHERE em.created_at >= NOW() - make_interval(days => p_days)
+      AND em.confidence >= p_min_confidence
+    GROUP BY em.event_type;
+$$ LANGUAGE sql STABLE;
+
+-- Function: Number of stored preferences for REFLECT
+CREATE OR REPLACE FUNCTION reflect_preference_count()
+RETURNS BIGINT AS $$
+    SELECT COUNT(*)
+    FROM arcus_procedural_memory
+    WHERE procedure_type = 'preference';
+$$ LANGUAGE sql STABLE;
+
+-- ============================================
+-- Record migration (do not modify)
+-- ============================================
+
+INSERT INTO arcus_schema_migrations (version, description, applied_by)
+VALUES ('20261016_004', 'reflect_aggregates', current_user)
+ON CONFLICT (version) DO NOTHING;
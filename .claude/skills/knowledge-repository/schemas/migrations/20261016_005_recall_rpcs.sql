@@ -0,0 +1,65 @@
+-- Migration: 20261016_005_recall_rpcs
+-- Description: Per-table recency recall RPCs (recall_episodic/semantic/procedural)
+--              with static SQL so query plans are cached
+-- Author: A2I2 Team
+-- Date: 2026-10-16
+-- Rollback: DROP FUNCTION IF EXISTS recall_episodic(INTEGER, FLOAT, INTEGER);
+--           DROP FUNCTION IF EXISTS recall_semantic(INTEGER, FLOAT, INTEGER);
+--           DROP FUNCTION IF EXISTS recall_procedural(INTEGER, FLOAT, INTEGER);
+
+-- ============================================
+-- UP Migration
+-- ============================================
+
+-- Functions: Recency recall per memory table
+-- Static SQL (no dynamic table name) so Postgres can cache the plan across
+-- calls. Used by KnowledgeRepository.recall() when there is no query text.
+CREATE OR REPLACE FUNCTION recall_episodic(
+    k INTEGER DEFAULT 10,
+    min_conf FLOAT DEFAULT 0.5,
+    days INTEGER DEFAULT NULL
+)
+RETURNS SETOF arcus_episodic_memory AS $$
+    SELECT *
+    FROM arcus_episodic_memory
+    WHERE confidence >= min_conf
+      AND (days IS NULL OR created_at >= NOW() - make_interval(days => days))
+    ORDER BY created_at DESC
+    LIMIT k;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION recall_semantic(
+    k INTEGER DEFAULT 10,
+    min_conf FLOAT DEFAULT 0.5,
+    days INTEGER DEFAULT NULL
+)
+RETURNS SETOF arcus_semantic_memory AS $$
+    SELECT *
+    FROM arcus_semantic_memory
+    WHERE confidence >= min_conf
+      AND (days IS NULL OR created_at >= NOW() - make_interval(days => days))
+    ORDER BY created_at DESC
+    LIMIT k;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION recall_procedural(
+    k INTEGER DEFAULT 10,
+    min_conf FLOAT DEFAULT 0.5,
+    days INTEGER DEFAULT NULL
+)
+RETURNS SETOF arcus_procedural_memory AS $$
+    SELECT *
+    FROM arcus_procedural_memory
+    WHERE confidence >= min_conf
+      AND (days IS NULL OR created_at >= NOW() - make_interval(days => days))
+    ORDER BY created_at DESC
+    LIMIT k;
+$$ LANGUAGE sql STABLE;
+
+-- ============================================
+-- Record migration (do not modify)
+-- ============================================
+
+INSERT INTO arcus_schema_migrations (version, description, applied_by)
+VALUES ('20261016_005', 'recall_rpcs', current_user)
+ON CONFLICT (version) DO NOTHING;
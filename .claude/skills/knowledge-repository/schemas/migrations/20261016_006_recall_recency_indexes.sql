@@ -0,0 +1,31 @@
+-- Migration: 20261016_006_recall_recency_indexes
+-- Description: Indexes matching recall's "confidence >= X ORDER BY created_at
+--              DESC LIMIT k" so it walks an index instead of sorting
+-- Author: A2I2 Team
+-- Date: 2026-10-16
+-- Rollback: DROP INDEX IF EXISTS idx_{episodic,semantic,procedural}_recent;
+--           DROP INDEX IF EXISTS idx_{episodic,semantic,procedural}_recent_confident;
+
+-- ============================================
+-- UP Migration
+-- ============================================
+
+-- Partial index for the default min_confidence (0.5): the planner reads
+-- the newest k rows straight off the index
+CREATE INDEX IF NOT EXISTS idx_episodic_recent_confident ON arcus_episodic_memory(created_at DESC) WHERE confidence >= 0.5;
+CREATE INDEX IF NOT EXISTS idx_semantic_recent_confident ON arcus_semantic_memory(created_at DESC) WHERE confidence >= 0.5;
+CREATE INDEX IF NOT EXISTS idx_procedural_recent_confident ON arcus_procedural_memory(created_at DESC) WHERE confidence >= 0.5;
+
+-- General case: created_at leads so the index still provides the order,
+-- confidence is carried along so the filter is checked without a heap visit
+CREATE INDEX IF NOT EXISTS idx_episodic_recent ON arcus_episodic_memory(created_at DESC, confidence);
+CREATE INDEX IF NOT EXISTS idx_semantic_recent ON arcus_semantic_memory(created_at DESC, confidence);
+CREATE INDEX IF NOT EXISTS idx_procedural_recent ON arcus_procedural_memory(created_at DESC, confidence);
+
+-- ============================================
+-- Record migration (do not modify)
+-- ============================================
+
+INSERT INTO arcus_schema_migrations (version, description, applied_by)
+VALUES ('20261016_006', 'recall_recency_indexes', current_user)
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,20 @@
+-- Migration: 20261016_007_preferences_partial_index
+-- Description: Partial index for recall_preferences()
+--              (procedure_type = 'preference' ORDER BY created_at DESC)
+-- Author: A2I2 Team
+-- Date: 2026-10-16
+-- Rollback: DROP INDEX IF EXISTS idx_procedural_preferences;
+
+-- ============================================
+-- UP Migration
+-- ============================================
+
+CREATE INDEX IF NOT EXISTS idx_procedural_preferences ON arcus_procedural_memory(created_at DESC) WHERE procedure_type = 'preference';
+
+-- ============================================
+-- Record migration (do not modify)
+-- ============================================
+
+INSERT INTO arcus_schema_migrations (version, description, applied_by)
+VALUES ('20261016_007', 'preferences_partial_index', current_user)
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,118 @@
+-- Migration: 20261016_008_narrow_recall_columns
+-- Description: Return only the consumed columns from the recall_<type>()
+--              RPCs instead of whole rows (embedding, source, metadata)
+-- Author: A2I2 Team
+-- Date: 2026-10-16
+-- Rollback: Re-run 20261016_005_recall_rpcs after dropping the functions below
+
+-- ============================================
+-- UP Migration
+-- ============================================
+
+-- Return type changes, so the old definitions must be dropped first
+DROP FUNCTION IF EXISTS recall_episodic(INTEGER, FLOAT, INTEGER);
+DROP FUNCTION IF EXISTS recall_semantic(INTEGER, FLOAT, INTEGER);
+DROP FUNCTION IF EXISTS recall_procedural(INTEGER, FLOAT, INTEGER);
+
+-- Functions: Recency recall per memory table
+-- Static SQL (no dynamic table name) so Postgres can cache the plan across
+-- calls. Used by KnowledgeRepository.recall() when there is no query text.
+-- Only the columns recall consumers read are returned (no embedding,
+-- source, metadata or detailed_content payloads).
+CREATE OR REPLACE FUNCTION recall_episodic(
+    k INTEGER DEFAULT 10,
+    min_conf FLOAT DEFAULT 0.5,
+    days INTEGER DEFAULT NULL
+)
+RETURNS TABLE (
+    id UUID,
+    event_type TEXT,
+    summary TEXT,
+    participants TEXT[],
+    related_projects TEXT[],
+    tags TEXT[],
+    outcome TEXT,
+    outcome_type TEXT,
+    learnings TEXT[],
+    confidence FLOAT,
+    importance TEXT,
+    event_timestamp TIMESTAMPTZ,
+    created_at TIMESTAMPTZ
+) AS $$
+    SELECT t.id, t.event_type, t.summary, t.participants, t.related_projects,
+           t.tags, t.outcome, t.outcome_type, t.learnings, t.confidence,
+           t.importance, t.event_timestamp, t.created_at
+    FROM arcus_episodic_memory t
+    WHERE t.confidence >= min_conf
+      AND (days IS NULL OR t.created_at >= NOW() - make_interval(days => days))
+    ORDER BY t.created_at DESC
+    LIMIT k;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION recall_semantic(
+    k INTEGER DEFAULT 10,
+    min_conf FLOAT DEFAULT 0.5,
+    days INTEGER DEFAULT NULL
+)
+RETURNS TABLE (
+    id UUID,
+    category TEXT,
+    statement TEXT,
+    explanation TEXT,
+    evidence_count INT,
+    confidence FLOAT,
+    domain TEXT,
+    subdomain TEXT,
+    tags TEXT[],
+    valid_until TIMESTAMPTZ,
+    access_count INT,
+    created_at TIMESTAMPTZ
+) AS $$
+    SELECT t.id, t.category, t.statement, t.explanation, t.evidence_count,
+           t.confidence, t.domain, t.subdomain, t.tags, t.valid_until,
+           t.access_count, t.created_at
+    FROM arcus_semantic_memory t
+    WHERE t.confidence >= min_conf
+      AND (days IS NULL OR t.created_at >= NOW() - make_interval(days => days))
+    ORDER BY t.created_at DESC
+    LIMIT k;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION recall_procedural(
+    k INTEGER DEFAULT 10,
+    min_conf FLOAT DEFAULT 0.5,
+    days INTEGER DEFAULT NULL
+)
+RETURNS TABLE (
+    id UUID,
+    procedure_type TEXT,
+    name TEXT,
+    description TEXT,
+    steps JSONB,
+    preference_value JSONB,
+    preference_strength TEXT,
+    trigger_keywords TEXT[],
+    applies_to TEXT[],
+    usage_count INT,
+    success_rate FLOAT,
+    confidence FLOAT,
+    created_at TIMESTAMPTZ
+) AS $$
+    SELECT t.id, t.procedure_type, t.name, t.description, t.steps,
+           t.preference_value, t.preference_strength, t.trigger_keywords,
+           t.applies_to, t.usage_count, t.success_rate, t.confidence,
+           t.created_at
+    FROM arcus_procedural_memory t
+    WHERE t.confidence >= min_conf
+      AND (days IS NULL OR t.created_at >= NOW() - make_interval(days => days))
+    ORDER BY t.created_at DESC
+    LIMIT k;
+$$ LANGUAGE sql STABLE;
+
+-- ============================================
+-- Record migration (do not modify)
+-- ============================================
+
+INSERT INTO arcus_schema_migrations (version, description, applied_by)
+VALUES ('20261016_008', 'narrow_recall_columns', current_user)
+ON CONFLICT (version) DO NOTHING;
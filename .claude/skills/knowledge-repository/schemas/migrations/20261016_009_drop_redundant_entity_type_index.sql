@@ -0,0 +1,23 @@
+-- Migration: 20261016_009_drop_redundant_entity_type_index
+-- Description: Drop idx_entities_type; the unique (entity_type, name) index
+--              from 20261016_001 already serves entity_type lookups as a prefix
+-- Author: A2I2 Team
+-- Date: 2026-10-16
+-- Rollback: CREATE INDEX IF NOT EXISTS idx_entities_type ON arcus_entities(entity_type);
+
+-- ============================================
+-- UP Migration
+-- ============================================
+
+-- The (entity_type, name) unique index covers both the upsert conflict
+-- target and equality lookups on entity_type alone; keeping a second
+-- single-column index only adds write cost to every entity insert
+DROP INDEX IF EXISTS idx_entities_type;
+
+-- ============================================
+-- Record migration (do not modify)
+-- ============================================
+
+INSERT INTO arcus_schema_migrations (version, description, applied_by)
+VALUES ('20261016_009', 'drop_redundant_entity_type_index', current_user)
+ON CONFLICT (version) DO NOTHING;
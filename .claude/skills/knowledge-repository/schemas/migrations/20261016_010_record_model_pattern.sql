@@ -0,0 +1,66 @@
+-- Migration: 20261016_010_record_model_pattern
+-- Description: record_model_pattern() RPC: insert-or-increment a model
+--              pattern in one statement (replaces upsert + counter RPC)
+-- Author: A2I2 Team
+-- Date: 2026-10-16
+-- Rollback: DROP FUNCTION IF EXISTS record_model_pattern(TEXT, TEXT, TEXT, TEXT, JSONB, FLOAT, DECIMAL, INTEGER, INTEGER, TEXT, FLOAT, JSONB);
+
+-- ============================================
+-- UP Migration
+-- ============================================
+
+-- RPC function: record one model/tool usage in a single atomic statement
+-- (insert a new pattern or fold the outcome into the existing row)
+CREATE OR REPLACE FUNCTION record_model_pattern(
+    p_task_context TEXT,
+    p_model_used TEXT,
+    p_outcome TEXT,
+    p_task_complexity TEXT DEFAULT 'medium',
+    p_tools_sequence JSONB DEFAULT '[]',
+    p_accuracy_score FLOAT DEFAULT NULL,
+    p_cost DECIMAL(10, 6) DEFAULT NULL,
+    p_latency INTEGER DEFAULT NULL,
+    p_tokens INTEGER DEFAULT NULL,
+    p_preference_context TEXT DEFAULT NULL,
+    p_confidence FLOAT DEFAULT 0.5,
+    p_source JSONB DEFAULT '{}'
+)
+RETURNS UUID AS $$
+    INSERT INTO arcus_model_patterns AS mp (
+        task_context, model_used, outcome, task_complexity, tools_sequence,
+        accuracy_score, total_cost_usd, total_latency_ms, tokens_used,
+        user_preference_context, confidence, source,
+        usage_count, success_count, failure_count
+    )
+    VALUES (
+        p_task_context, p_model_used, p_outcome, p_task_complexity, p_tools_sequence,
+        p_accuracy_score, p_cost, p_latency, p_tokens,
+        p_preference_context, p_confidence, p_source,
+        1,
+        CASE WHEN p_outcome = 'success' THEN 1 ELSE 0 END,
+        CASE WHEN p_outcome = 'failure' THEN 1 ELSE 0 END
+    )
+    ON CONFLICT (task_context, model_used) DO UPDATE SET
+        usage_count = mp.usage_count + 1,
+        success_count = mp.success_count + EXCLUDED.success_count,
+        failure_count = mp.failure_count + EXCLUDED.failure_count,
+        outcome = EXCLUDED.outcome,
+        task_complexity = EXCLUDED.task_complexity,
+        tools_sequence = EXCLUDED.tools_sequence,
+        accuracy_score = COALESCE(EXCLUDED.accuracy_score, mp.accuracy_score),
+        total_cost_usd = COALESCE(EXCLUDED.total_cost_usd, mp.total_cost_usd),
+        total_latency_ms = COALESCE(EXCLUDED.total_latency_ms, mp.total_latency_ms),
+        tokens_used = COALESCE(EXCLUDED.tokens_used, mp.tokens_used),
+        user_preference_context = COALESCE(EXCLUDED.user_preference_context, mp.user_preference_context),
+        last_used = NOW(),
+        updated_at = NOW()
+    RETURNING mp.id;
+$$ LANGUAGE sql;
+
+-- ============================================
+-- Record migration (do not modify)
+-- ============================================
+
+INSERT INTO arcus_schema_migrations (version, description, applied_by)
+VALUES ('20261016_010', 'record_model_pattern', current_user)
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,41 @@
+-- Migration: 20261016_011_efficiency_report
+-- Description: Per-model GROUP BY RPC for get_efficiency_report so it transfers
+--              one row per model instead of every audit row in the window
+-- Author: A2I2 Team
+-- Date: 2026-10-16
+-- Rollback: DROP FUNCTION IF EXISTS efficiency_report(TIMESTAMPTZ);
+
+-- ============================================
+-- UP Migration
+-- ============================================
+
+-- Function: Per-model efficiency aggregates for get_efficiency_report()
+CREATE OR REPLACE FUNCTION efficiency_report(p_cutoff TIMESTAMPTZ)
+RETURNS TABLE (
+    model_used TEXT,
+    request_count BIGINT,
+    total_cost NUMERIC,
+    total_latency_ms BIGINT,
+    success_count BIGINT,
+    total_tokens BIGINT
+) AS $$
+    SELECT
+        a.model_used,
+        COUNT(*) AS request_count,
+        COALESCE(SUM(a.estimated_cost_usd), 0) AS total_cost,
+        COALESCE(SUM(a.latency_ms), 0) AS total_latency_ms,
+        COUNT(*) FILTER (WHERE a.outcome = 'success') AS success_count,
+        COALESCE(SUM(COALESCE(a.tokens_input, 0) + COALESCE(a.tokens_output, 0)), 0) AS total_tokens
+    FROM arcus_autonomy_audit a
+    WHERE a.executed_at >= p_cutoff
+      AND a.model_used IS NOT NULL
+    GROUP BY a.model_used;
+$$ LANGUAGE sql STABLE;
+
+-- ============================================
+-- Record migration (do not modify)
+-- ============================================
+
+INSERT INTO arcus_schema_migrations (version, description, applied_by)
+VALUES ('20261016_011', 'efficiency_report', current_user)
+ON CONFLICT (version) DO NOTHING;
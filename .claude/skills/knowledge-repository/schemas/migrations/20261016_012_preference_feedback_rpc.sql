@@ -0,0 +1,72 @@
+-- Migration: 20261016_012_preference_feedback_rpc
+-- Description: update_preference_from_feedback() RPC: create-if-missing and adjust
+--              model/tool preference weights in one round trip
+-- Author: A2I2 Team
+-- Date: 2026-10-16
+-- Rollback: DROP FUNCTION IF EXISTS update_preference_from_feedback(TEXT, TEXT, TEXT, TEXT, BOOLEAN, JSONB);
+
+-- ============================================
+-- UP Migration
+-- ============================================
+
+-- RPC function: apply one piece of routing feedback to a preference vector
+-- (creates the active vector if missing, then nudges model/tool weights)
+CREATE OR REPLACE FUNCTION update_preference_from_feedback(
+    p_user_id TEXT,
+    p_context TEXT,
+    p_model TEXT DEFAULT NULL,
+    p_tool TEXT DEFAULT NULL,
+    p_positive BOOLEAN DEFAULT TRUE,
+    p_source JSONB DEFAULT '{}'
+)
+RETURNS UUID AS $$
+DECLARE
+    v_delta FLOAT := CASE WHEN p_positive THEN 0.05 ELSE -0.05 END;
+    v_id UUID;
+BEGIN
+    SELECT id INTO v_id
+    FROM arcus_user_preference_vectors
+    WHERE user_id = p_user_id
+      AND context_name = p_context
+      AND is_active = TRUE
+    LIMIT 1
+    FOR UPDATE;
+
+    IF v_id IS NULL THEN
+        INSERT INTO arcus_user_preference_vectors (
+            user_id, context_name, model_preferences, tool_preferences,
+            skill_preferences, overrides, source
+        )
+        VALUES (p_user_id, p_context, '{}', '{}', '{}', '{}', p_source)
+        RETURNING id INTO v_id;
+    END IF;
+
+    UPDATE arcus_user_preference_vectors SET
+        feedback_count = COALESCE(feedback_count, 0) + 1,
+        last_feedback = NOW(),
+        updated_at = NOW(),
+        model_preferences = CASE WHEN p_model IS NULL THEN model_preferences ELSE
+            jsonb_set(
+                COALESCE(model_preferences, '{}'), ARRAY[p_model],
+                to_jsonb(GREATEST(0.1, LEAST(0.95,
+                    COALESCE((model_preferences ->> p_model)::FLOAT, 0.5) + v_delta)))
+            ) END,
+        tool_preferences = CASE WHEN p_tool IS NULL THEN tool_preferences ELSE
+            jsonb_set(
+                COALESCE(tool_preferences, '{}'), ARRAY[p_tool],
+                to_jsonb(GREATEST(0.1, LEAST(0.95,
+                    COALESCE((tool_preferences ->> p_tool)::FLOAT, 0.5) + v_delta)))
+            ) END
+    WHERE id = v_id;
+
+    RETURN v_id;
+END;
+$$ LANGUAGE plpgsql;
+
+-- ============================================
+-- Record migration (do not modify)
+-- ============================================
+
+INSERT INTO arcus_schema_migrations (version, description, applied_by)
+VALUES ('20261016_012', 'preference_feedback_rpc', current_user)
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,28 @@
+-- Migration: 20261016_013_best_pattern_index
+-- Description: Serve get_best_pattern() from one (task_context, success_rate DESC)
+--              index probe and drop the single-column task_context index it supersedes
+-- Author: A2I2 Team
+-- Date: 2026-10-16
+-- Rollback: DROP INDEX IF EXISTS idx_pattern_context_success;
+--           CREATE INDEX IF NOT EXISTS idx_pattern_context ON arcus_model_patterns(task_context);
+
+-- ============================================
+-- UP Migration
+-- ============================================
+
+-- get_best_pattern() filters on task_context and takes the top success_rate;
+-- with this index the first qualifying entry in index order is the answer
+CREATE INDEX IF NOT EXISTS idx_pattern_context_success
+    ON arcus_model_patterns(task_context, success_rate DESC);
+
+-- task_context lookups are covered as a prefix of the index above (and of
+-- the (task_context, model_used) unique constraint)
+DROP INDEX IF EXISTS idx_pattern_context;
+
+-- ============================================
+-- Record migration (do not modify)
+-- ============================================
+
+INSERT INTO arcus_schema_migrations (version, description, applied_by)
+VALUES ('20261016_013', 'best_pattern_index', current_user)
+ON CONFLICT (version) DO NOTHING;
@@ -0,0 +1,126 @@
+-- Migration: 20261016_014_recall_rpc_columns
+-- Description: Return only the recall columns (plus similarity/rank) from
+--              match_memory() and search_memory() instead of whole rows
+-- Author: A2I2 Team
+-- Date: 2026-10-16
+-- Rollback: Re-run 20261016_002_hnsw_match_memory and 20261016_003_fulltext_search_memory
+--           (function definitions only); DROP FUNCTION IF EXISTS recall_columns(TEXT);
+
+-- ============================================
+-- UP Migration
+-- ============================================
+
+-- Function: Columns the recall RPCs return for a memory table
+-- Mirrors RECALL_COLUMNS in knowledge_operations.py: what recall consumers
+-- read, without embedding, search_doc, source or metadata payloads.
+CREATE OR REPLACE FUNCTION recall_columns(table_name TEXT)
+RETURNS TEXT AS $$
+    SELECT CASE table_name
+        WHEN 'arcus_episodic_memory' THEN
+            't.id, t.event_type, t.summary, t.participants, t.related_projects,
+             t.tags, t.outcome, t.outcome_type, t.learnings, t.confidence,
+             t.importance, t.event_timestamp, t.created_at'
+        WHEN 'arcus_semantic_memory' THEN
+            't.id, t.category, t.statement, t.explanation, t.evidence_count,
+             t.confidence, t.domain, t.subdomain, t.tags, t.valid_until,
+             t.access_count, t.created_at'
+        WHEN 'arcus_procedural_memory' THEN
+            't.id, t.procedure_type, t.name, t.description, t.steps,
+             t.preference_value, t.preference_strength, t.trigger_keywords,
+             t.applies_to, t.usage_count, t.success_rate, t.confidence,
+             t.created_at'
+    END;
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Function: Nearest-neighbour recall over a single memory table
+-- Returns the recall columns plus cosine similarity, ordered by cosine
+-- distance so the HNSW index drives the scan. Used by KnowledgeRepository.recall().
+CREATE OR REPLACE FUNCTION match_memory(
+    query_embedding VECTOR(1536),
+    table_name TEXT,
+    match_count INTEGER DEFAULT 10,
+    min_confidence FLOAT DEFAULT 0.0,
+    created_after TIMESTAMPTZ DEFAULT NULL
+)
+RETURNS SETOF JSONB AS $$
+BEGIN
+    IF table_name NOT IN (
+        'arcus_episodic_memory',
+        'arcus_semantic_memory',
+        'arcus_procedural_memory'
+    ) THEN
+        RAISE EXCEPTION 'match_memory: unsupported table %', table_name;
+    END IF;
+
+    RETURN QUERY EXECUTE format(
+        'SELECT to_jsonb(r)
+         FROM (
+             SELECT %s, 1 - (t.embedding <=> $1) AS similarity
+             FROM %I t
+             WHERE t.embedding IS NOT NULL
+               AND t.confidence >= $2
+               AND ($3::TIMESTAMPTZ IS NULL OR t.created_at >= $3)
+             ORDER BY t.embedding <=> $1
+             LIMIT $4
+         ) r',
+        recall_columns(table_name),
+        table_name
+    )
+    USING query_embedding, min_confidence, created_after, match_count;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- Function: Lexical recall over a single memory table
+-- Terms are OR-ed (any term matches) and ranked with ts_rank, so a whole
+-- conversational message still finds rows mentioning any of its keywords.
+-- Returns the recall columns plus rank. Used by KnowledgeRepository.recall()
+-- when no embedding is available.
+CREATE OR REPLACE FUNCTION search_memory(
+    q TEXT,
+    table_name TEXT,
+    match_count INTEGER DEFAULT 10,
+    min_confidence FLOAT DEFAULT 0.0,
+    created_after TIMESTAMPTZ DEFAULT NULL
+)
+RETURNS SETOF JSONB AS $$
+DECLARE
+    tsq TSQUERY;
+BEGIN
+    IF table_name NOT IN (
+        'arcus_episodic_memory',
+        'arcus_semantic_memory',
+        'arcus_procedural_memory'
+    ) THEN
+        RAISE EXCEPTION 'search_memory: unsupported table %', table_name;
+    END IF;
+
+    tsq := NULLIF(replace(plainto_tsquery('english', q)::TEXT, ' & ', ' | '), '')::TSQUERY;
+    IF tsq IS NULL THEN
+        RETURN;
+    END IF;
+
+    RETURN QUERY EXECUTE format(
+        'SELECT to_jsonb(r)
+         FROM (
+             SELECT %s, ts_rank(t.search_doc, $1) AS rank
+             FROM %I t
+             WHERE t.search_doc @@ $1
+               AND t.confidence >= $2
+               AND ($3::TIMESTAMPTZ IS NULL OR t.created_at >= $3)
+             ORDER BY ts_rank(t.search_doc, $1) DESC
+             LIMIT $4
+         ) r',
+        recall_columns(table_name),
+        table_name
+    )
+    USING tsq, min_confidence, created_after, match_count;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- ============================================
+-- Record migration (do not modify)
+-- ============================================
+
+INSERT INTO arcus_schema_migrations (version, description, applied_by)
+VALUES ('20261016_014', 'recall_rpc_columns', current_user)
+ON CONFLICT (version) DO NOTHING;
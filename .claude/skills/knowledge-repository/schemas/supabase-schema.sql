@@ -84,6 +84,8 @@ CREATE INDEX IF NOT EXISTS idx_episodic_projects ON arcus_episodic_memory USING
 CREATE INDEX IF NOT EXISTS idx_episodic_tags ON arcus_episodic_memory USING GIN(tags);
 CREATE INDEX IF NOT EXISTS idx_episodic_importance ON arcus_episodic_memory(importance) WHERE importance IN ('high', 'critical');
 CREATE INDEX IF NOT EXISTS idx_episodic_outcome ON arcus_episodic_memory(outcome_type);
+CREATE INDEX IF NOT EXISTS idx_episodic_recent ON arcus_episodic_memory(created_at DESC, confidence);
+CREATE INDEX IF NOT EXISTS idx_episodic_recent_confident ON arcus_episodic_memory(created_at DESC) WHERE confidence >= 0.5;
 
 COMMENT ON TABLE arcus_episodic_memory IS 'Episodic memory: stores events, conversations, decisions, and outcomes';
 
@@ -150,6 +152,8 @@ CREATE INDEX IF NOT EXISTS idx_semantic_valid ON arcus_semantic_memory(valid_fro
 CREATE INDEX IF NOT EXISTS idx_semantic_concepts ON arcus_semantic_memory USING GIN(related_concepts);
 CREATE INDEX IF NOT EXISTS idx_semantic_tags ON arcus_semantic_memory USING GIN(tags);
 CREATE INDEX IF NOT EXISTS idx_semantic_confidence ON arcus_semantic_memory(confidence DESC);
+CREATE INDEX IF NOT EXISTS idx_semantic_recent ON arcus_semantic_memory(created_at DESC, confidence);
+CREATE INDEX IF NOT EXISTS idx_semantic_recent_confident ON arcus_semantic_memory(created_at DESC) WHERE confidence >= 0.5;
 
 COMMENT ON TABLE arcus_semantic_memory IS 'Semantic memory: stores facts, patterns, frameworks, and domain knowledge';
 
@@ -227,6 +231,9 @@ CREATE INDEX IF NOT EXISTS idx_procedural_success ON arcus_procedural_memory(suc
 CREATE INDEX IF NOT EXISTS idx_procedural_triggers ON arcus_procedural_memory USING GIN(trigger_keywords);
 CREATE INDEX IF NOT EXISTS idx_procedural_applies ON arcus_procedural_memory USING GIN(applies_to);
 CREATE INDEX IF NOT EXISTS idx_procedural_scope ON arcus_procedural_memory(scope);
+CREATE INDEX IF NOT EXISTS idx_procedural_recent ON arcus_procedural_memory(created_at DESC, confidence);
+CREATE INDEX IF NOT EXISTS idx_procedural_recent_confident ON arcus_procedural_memory(created_at DESC) WHERE confidence >= 0.5;
+CREATE INDEX IF NOT EXISTS idx_procedural_preferences ON arcus_procedural_memory(created_at DESC) WHERE procedure_type = 'preference';
 
 COMMENT ON TABLE arcus_procedural_memory IS 'Procedural memory: stores workflows, preferences, standards, and patterns';
 
@@ -293,12 +300,12 @@ CREATE TABLE IF NOT EXISTS arcus_entities (
     metadata JSONB DEFAULT '{}',
 
     -- Uniqueness constraint
+    -- (entity_type, name) is unique so _ensure_entity can UPSERT in one call
     UNIQUE(entity_type, external_id),
-    UNIQUE(entity_type, name) WHERE external_id IS NULL
+    UNIQUE(entity_type, name)
 );
 
 -- Indexes for entities
-CREATE INDEX IF NOT EXISTS idx_entities_type ON arcus_entities(entity_type);
 CREATE INDEX IF NOT EXISTS idx_entities_name ON arcus_entities(name);
 CREATE INDEX IF NOT EXISTS idx_entities_external ON arcus_entities(external_id) WHERE external_id IS NOT NULL;
 CREATE INDEX IF NOT EXISTS idx_entities_aliases ON arcus_entities USING GIN(aliases);
@@ -635,8 +642,56 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- RPC function: record one model/tool usage in a single atomic statement
+-- (insert a new pattern or fold the outcome into the existing row)
+CREATE OR REPLACE FUNCTION record_model_pattern(
+    p_task_context TEXT,
+    p_model_used TEXT,
+    p_outcome TEXT,
+    p_task_complexity TEXT DEFAULT 'medium',
+    p_tools_sequence JSONB DEFAULT '[]',
+    p_accuracy_score FLOAT DEFAULT NULL,
+    p_cost DECIMAL(10, 6) DEFAULT NULL,
+    p_latency INTEGER DEFAULT NULL,
+    p_tokens INTEGER DEFAULT NULL,
+    p_preference_context TEXT DEFAULT NULL,
+    p_confidence FLOAT DEFAULT 0.5,
+    p_source JSONB DEFAULT '{}'
+)
+RETURNS UUID AS $$
+    INSERT INTO arcus_model_patterns AS mp (
+        task_context, model_used, outcome, task_complexity, tools_sequence,
+        accuracy_score, total_cost_usd, total_latency_ms, tokens_used,
+        user_preference_context, confidence, source,
+        usage_count, success_count, failure_count
+    )
+    VALUES (
+        p_task_context, p_model_used, p_outcome, p_task_complexity, p_tools_sequence,
+        p_accuracy_score, p_cost, p_latency, p_tokens,
+        p_preference_context, p_confidence, p_source,
+        1,
+        CASE WHEN p_outcome = 'success' THEN 1 ELSE 0 END,
+        CASE WHEN p_outcome = 'failure' THEN 1 ELSE 0 END
+    )
+    ON CONFLICT (task_context, model_used) DO UPDATE SET
+        usage_count = mp.usage_count + 1,
+        success_count = mp.success_count + EXCLUDED.success_count,
+        failure_count = mp.failure_count + EXCLUDED.failure_count,
+        outcome = EXCLUDED.outcome,
+        task_complexity = EXCLUDED.task_complexity,
+        tools_sequence = EXCLUDED.tools_sequence,
+        accuracy_score = COALESCE(EXCLUDED.accuracy_score, mp.accuracy_score),
+        total_cost_usd = COALESCE(EXCLUDED.total_cost_usd, mp.total_cost_usd),
+        total_latency_ms = COALESCE(EXCLUDED.total_latency_ms, mp.total_latency_ms),
+        tokens_used = COALESCE(EXCLUDED.tokens_used, mp.tokens_used),
+        user_preference_context = COALESCE(EXCLUDED.user_preference_context, mp.user_preference_context),
+        last_used = NOW(),
+        updated_at = NOW()
+    RETURNING mp.id;
+$$ LANGUAGE sql;
+
 -- Indexes for model patterns
-CREATE INDEX IF NOT EXISTS idx_pattern_context ON arcus_model_patterns(task_context);
+CREATE INDEX IF NOT EXISTS idx_pattern_context_success ON arcus_model_patterns(task_context, success_rate DESC);
 CREATE INDEX IF NOT EXISTS idx_pattern_model ON arcus_model_patterns(model_used);
 CREATE INDEX IF NOT EXISTS idx_pattern_outcome ON arcus_model_patterns(outcome);
 CREATE INDEX IF NOT EXISTS idx_pattern_success_rate ON arcus_model_patterns(success_rate DESC) WHERE usage_count >= 3;
@@ -736,23 +791,48 @@ INSERT INTO arcus_user_preference_vectors (
 -- Note: Requires pgvector extension
 -- ============================================================================
 
--- These use IVFFlat for approximate nearest neighbor search
--- Adjust 'lists' parameter based on expected data size:
--- - lists = 100 for ~10k rows
--- - lists = 1000 for ~1M rows
-
+-- Memory tables use HNSW (used by match_memory() recall): no training step,
+-- and recall does not degrade as rows are added after index creation.
 CREATE INDEX IF NOT EXISTS idx_episodic_embedding ON arcus_episodic_memory
-    USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100);
+    USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64);
 
 CREATE INDEX IF NOT EXISTS idx_semantic_embedding ON arcus_semantic_memory
-    USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100);
+    USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64);
 
 CREATE INDEX IF NOT EXISTS idx_procedural_embedding ON arcus_procedural_memory
-    USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100);
+    USING hnsw (embedding vector_cosine_ops) WITH (m = 16, ef_construction = 64);
 
+-- Entities use IVFFlat for approximate nearest neighbor search
+-- Adjust 'lists' parameter based on expected data size:
+-- - lists = 100 for ~10k rows
+-- - lists = 1000 for ~1M rows
 CREATE INDEX IF NOT EXISTS idx_entities_embedding ON arcus_entities
     USING ivfflat (embedding vector_cosine_ops) WITH (lists = 100);
 
+-- ============================================================================
+-- FULL-TEXT SEARCH (lexical recall fallback)
+-- ============================================================================
+
+-- Generated tsvector columns + GIN indexes for lexical recall
+ALTER TABLE arcus_episodic_memory ADD COLUMN IF NOT EXISTS search_doc TSVECTOR
+    GENERATED ALWAYS AS (
+        to_tsvector('english', coalesce(summary, '') || ' ' || coalesce(outcome, ''))
+    ) STORED;
+
+ALTER TABLE arcus_semantic_memory ADD COLUMN IF NOT EXISTS search_doc TSVECTOR
+    GENERATED ALWAYS AS (
+        to_tsvector('english', coalesce(statement, '') || ' ' || coalesce(domain, ''))
+    ) STORED;
+
+ALTER TABLE arcus_procedural_memory ADD COLUMN IF NOT EXISTS search_doc TSVECTOR
+    GENERATED ALWAYS AS (
+        to_tsvector('english', coalesce(name, '') || ' ' || coalesce(description, ''))
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_episodic_search_doc ON arcus_episodic_memory USING GIN(search_doc);
+CREATE INDEX IF NOT EXISTS idx_semantic_search_doc ON arcus_semantic_memory USING GIN(search_doc);
+CREATE INDEX IF NOT EXISTS idx_procedural_search_doc ON arcus_procedural_memory USING GIN(search_doc);
+
 -- ============================================================================
 -- FUNCTIONS AND TRIGGERS
 -- ============================================================================
@@ -2326,6 +2406,309 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Function: Columns the recall RPCs return for a memory table
+-- Mirrors RECALL_COLUMNS in knowledge_operations.py: what recall consumers
+-- read, without embedding, search_doc, source or metadata payloads.
+CREATE OR REPLACE FUNCTION recall_columns(table_name TEXT)
+RETURNS TEXT AS $$
+    SELECT CASE table_name
+        WHEN 'arcus_episodic_memory' THEN
+            't.id, t.event_type, t.summary, t.participants, t.related_projects,
+             t.tags, t.outcome, t.outcome_type, t.learnings, t.confidence,
+             t.importance, t.event_timestamp, t.created_at'
+        WHEN 'arcus_semantic_memory' THEN
+            't.id, t.category, t.statement, t.explanation, t.evidence_count,
+             t.confidence, t.domain, t.subdomain, t.tags, t.valid_until,
+             t.access_count, t.created_at'
+        WHEN 'arcus_procedural_memory' THEN
+            't.id, t.procedure_type, t.name, t.description, t.steps,
+             t.preference_value, t.preference_strength, t.trigger_keywords,
+             t.applies_to, t.usage_count, t.success_rate, t.confidence,
+             t.created_at'
+    END;
+$$ LANGUAGE sql IMMUTABLE;
+
+-- Function: Nearest-neighbour recall over a single memory table
+-- Returns the recall columns plus cosine similarity, ordered by cosine
+-- distance so the HNSW index drives the scan. Used by KnowledgeRepository.recall().
+CREATE OR REPLACE FUNCTION match_memory(
+    query_embedding VECTOR(1536),
+    table_name TEXT,
+    match_count INTEGER DEFAULT 10,
+    min_confidence FLOAT DEFAULT 0.0,
+    created_after TIMESTAMPTZ DEFAULT NULL
+)
+RETURNS SETOF JSONB AS $$
+BEGIN
+    IF table_name NOT IN (
+        'arcus_episodic_memory',
+        'arcus_semantic_memory',
+        'arcus_procedural_memory'
+    ) THEN
+        RAISE EXCEPTION 'match_memory: unsupported table %', table_name;
+    END IF;
+
+    RETURN QUERY EXECUTE format(
+        'SELECT to_jsonb(r)
+         FROM (
+             SELECT %s, 1 - (t.embedding <=> $1) AS similarity
+             FROM %I t
+             WHERE t.embedding IS NOT NULL
+               AND t.confidence >= $2
+               AND ($3::TIMESTAMPTZ IS NULL OR t.created_at >= $3)
+             ORDER BY t.embedding <=> $1
+             LIMIT $4
+         ) r',
+        recall_columns(table_name),
+        table_name
+    )
+    USING query_embedding, min_confidence, created_after, match_count;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- Function: Lexical recall over a single memory table
+-- Terms are OR-ed (any term matches) and ranked with ts_rank, so a whole
+-- conversational message still finds rows mentioning any of its keywords.
+-- Returns the recall columns plus rank. Used by KnowledgeRepository.recall()
+-- when no embedding is available.
+CREATE OR REPLACE FUNCTION search_memory(
+    q TEXT,
+    table_name TEXT,
+    match_count INTEGER DEFAULT 10,
+    min_confidence FLOAT DEFAULT 0.0,
+    created_after TIMESTAMPTZ DEFAULT NULL
+)
+RETURNS SETOF JSONB AS $$
+DECLARE
+    tsq TSQUERY;
+BEGIN
+    IF table_name NOT IN (
+        'arcus_episodic_memory',
+        'arcus_semantic_memory',
+        'arcus_procedural_memory'
+    ) THEN
+        RAISE EXCEPTION 'search_memory: unsupported table %', table_name;
+    END IF;
+
+    tsq := NULLIF(replace(plainto_tsquery('english', q)::TEXT, ' & ', ' | '), '')::TSQUERY;
+    IF tsq IS NULL THEN
+        RETURN;
+    END IF;
+
+    RETURN QUERY EXECUTE format(
+        'SELECT to_jsonb(r)
+         FROM (
+             SELECT %s, ts_rank(t.search_doc, $1) AS rank
+             FROM %I t
+             WHERE t.search_doc @@ $1
+               AND t.confidence >= $2
+               AND ($3::TIMESTAMPTZ IS NULL OR t.created_at >= $3)
+             ORDER BY ts_rank(t.search_doc, $1) DESC
+             LIMIT $4
+         ) r',
+        recall_columns(table_name),
+        table_name
+    )
+    USING tsq, min_confidence, created_after, match_count;
+END;
+$$ LANGUAGE plpgsql STABLE;
+
+-- Function: Event counts by type for REFLECT (aggregated server-side)
+CREATE OR REPLACE FUNCTION reflect_event_counts(
+    p_days INTEGER,
+    p_min_confidence FLOAT DEFAULT 0.5
+)
+RETURNS TABLE (
+    event_type TEXT,
+    event_count BIGINT
+) AS $$
+    SELECT em.event_type, COUNT(*) AS event_count
+    FROM arcus_episodic_memory em
+    WHERE em.created_at >= NOW() - make_interval(days => p_days)
+      AND em.confidence >= p_min_confidence
+    GROUP BY em.event_type;
+$$ LANGUAGE sql STABLE;
+
+-- Function: Number of stored preferences for REFLECT
+CREATE OR REPLACE FUNCTION reflect_preference_count()
+RETURNS BIGINT AS $$
+    SELECT COUNT(*)
+    FROM arcus_procedural_memory
+    WHERE procedure_type = 'preference';
+$$ LANGUAGE sql STABLE;
+
+-- Functions: Recency recall per memory table
+-- Static SQL (no dynamic table name) so Postgres can cache the plan across
+-- calls. Used by KnowledgeRepository.recall() when there is no query text.
+-- Only the columns recall consumers read are returned (no embedding,
+-- source, metadata or detailed_content payloads).
+CREATE OR REPLACE FUNCTION recall_episodic(
+    k INTEGER DEFAULT 10,
+    min_conf FLOAT DEFAULT 0.5,
+    days INTEGER DEFAULT NULL
+)
+RETURNS TABLE (
+    id UUID,
+    event_type TEXT,
+    summary TEXT,
+    participants TEXT[],
+    related_projects TEXT[],
+    tags TEXT[],
+    outcome TEXT,
+    outcome_type TEXT,
+    learnings TEXT[],
+    confidence FLOAT,
+    importance TEXT,
+    event_timestamp TIMESTAMPTZ,
+    created_at TIMESTAMPTZ
+) AS $$
+    SELECT t.id, t.event_type, t.summary, t.participants, t.related_projects,
+           t.tags, t.outcome, t.outcome_type, t.learnings, t.confidence,
+           t.importance, t.event_timestamp, t.created_at
+    FROM arcus_episodic_memory t
+    WHERE t.confidence >= min_conf
+      AND (days IS NULL OR t.created_at >= NOW() - make_interval(days => days))
+    ORDER BY t.created_at DESC
+    LIMIT k;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION recall_semantic(
+    k INTEGER DEFAULT 10,
+    min_conf FLOAT DEFAULT 0.5,
+    days INTEGER DEFAULT NULL
+)
+RETURNS TABLE (
+    id UUID,
+    category TEXT,
+    statement TEXT,
+    explanation TEXT,
+    evidence_count INT,
+    confidence FLOAT,
+    domain TEXT,
+    subdomain TEXT,
+    tags TEXT[],
+    valid_until TIMESTAMPTZ,
+    access_count INT,
+    created_at TIMESTAMPTZ
+) AS $$
+    SELECT t.id, t.category, t.statement, t.explanation, t.evidence_count,
+           t.confidence, t.domain, t.subdomain, t.tags, t.valid_until,
+           t.access_count, t.created_at
+    FROM arcus_semantic_memory t
+    WHERE t.confidence >= min_conf
+      AND (days IS NULL OR t.created_at >= NOW() - make_interval(days => days))
+    ORDER BY t.created_at DESC
+    LIMIT k;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION recall_procedural(
+    k INTEGER DEFAULT 10,
+    min_conf FLOAT DEFAULT 0.5,
+    days INTEGER DEFAULT NULL
+)
+RETURNS TABLE (
+    id UUID,
+    procedure_type TEXT,
+    name TEXT,
+    description TEXT,
+    steps JSONB,
+    preference_value JSONB,
+    preference_strength TEXT,
+    trigger_keywords TEXT[],
+    applies_to TEXT[],
+    usage_count INT,
+    success_rate FLOAT,
+    confidence FLOAT,
+    created_at TIMESTAMPTZ
+) AS $$
+    SELECT t.id, t.procedure_type, t.name, t.description, t.steps,
+           t.preference_value, t.preference_strength, t.trigger_keywords,
+           t.applies_to, t.usage_count, t.success_rate, t.confidence,
+           t.created_at
+    FROM arcus_procedural_memory t
+    WHERE t.confidence >= min_conf
+      AND (days IS NULL OR t.created_at >= NOW() - make_interval(days => days))
+    ORDER BY t.created_at DESC
+    LIMIT k;
+$$ LANGUAGE sql STABLE;
+
+-- Function: Per-model efficiency aggregates for get_efficiency_report()
+CREATE OR REPLACE FUNCTION efficiency_report(p_cutoff TIMESTAMPTZ)
+RETURNS TABLE (
+    model_used TEXT,
+    request_count BIGINT,
+    total_cost NUMERIC,
+    total_latency_ms BIGINT,
+    success_count BIGINT,
+    total_tokens BIGINT
+) AS $$
+    SELECT
+        a.model_used,
+        COUNT(*) AS request_count,
+        COALESCE(SUM(a.estimated_cost_usd), 0) AS total_cost,
+        COALESCE(SUM(a.latency_ms), 0) AS total_latency_ms,
+        COUNT(*) FILTER (WHERE a.outcome = 'success') AS success_count,
+        COALESCE(SUM(COALESCE(a.tokens_input, 0) + COALESCE(a.tokens_output, 0)), 0) AS total_tokens
+    FROM arcus_autonomy_audit a
+    WHERE a.executed_at >= p_cutoff
+      AND a.model_used IS NOT NULL
+    GROUP BY a.model_used;
+$$ LANGUAGE sql STABLE;
+
+-- RPC function: apply one piece of routing feedback to a preference vector
+-- (creates the active vector if missing, then nudges model/tool weights)
+CREATE OR REPLACE FUNCTION update_preference_from_feedback(
+    p_user_id TEXT,
+    p_context TEXT,
+    p_model TEXT DEFAULT NULL,
+    p_tool TEXT DEFAULT NULL,
+    p_positive BOOLEAN DEFAULT TRUE,
+    p_source JSONB DEFAULT '{}'
+)
+RETURNS UUID AS $$
+DECLARE
+    v_delta FLOAT := CASE WHEN p_positive THEN 0.05 ELSE -0.05 END;
+    v_id UUID;
+BEGIN
+    SELECT id INTO v_id
+    FROM arcus_user_preference_vectors
+    WHERE user_id = p_user_id
+      AND context_name = p_context
+      AND is_active = TRUE
+    LIMIT 1
+    FOR UPDATE;
+
+    IF v_id IS NULL THEN
+        INSERT INTO arcus_user_preference_vectors (
+            user_id, context_name, model_preferences, tool_preferences,
+            skill_preferences, overrides, source
+        )
+        VALUES (p_user_id, p_context, '{}', '{}', '{}', '{}', p_source)
+        RETURNING id INTO v_id;
+    END IF;
+
+    UPDATE arcus_user_preference_vectors SET
+        feedback_count = COALESCE(feedback_count, 0) + 1,
+        last_feedback = NOW(),
+        updated_at = NOW(),
+        model_preferences = CASE WHEN p_model IS NULL THEN model_preferences ELSE
+            jsonb_set(
+                COALESCE(model_preferences, '{}'), ARRAY[p_model],
+                to_jsonb(GREATEST(0.1, LEAST(0.95,
+                    COALESCE((model_preferences ->> p_model)::FLOAT, 0.5) + v_delta)))
+            ) END,
+        tool_preferences = CASE WHEN p_tool IS NULL THEN tool_preferences ELSE
+            jsonb_set(
+                COALESCE(tool_preferences, '{}'), ARRAY[p_tool],
+                to_jsonb(GREATEST(0.1, LEAST(0.95,
+                    COALESCE((tool_preferences ->> p_tool)::FLOAT, 0.5) + v_delta)))
+            ) END
+    WHERE id = v_id;
+
+    RETURN v_id;
+END;
+$$ LANGUAGE plpgsql;
+
 -- ============================================================================
 -- PHASE 4: VIEWS
 -- ============================================================================
@@ -66,7 +66,7 @@ class MessageContentType(Enum):
 # DATA CLASSES - MESSAGE TYPES
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class Attachment:
     """A media attachment on a message."""
     content_type: str          # MIME type
@@ -77,7 +77,7 @@ class Attachment:
     caption: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class UserIdentity:
     """Identifies a user across channels."""
     channel_user_id: str       # Platform-specific ID (phone, Discord ID, etc.)
@@ -86,7 +86,7 @@ class UserIdentity:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChatContext:
     """Identifies a chat/conversation context."""
     chat_id: str               # Platform-specific chat/channel ID
@@ -95,7 +95,7 @@ class ChatContext:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class InboundMessage:
     """A message received from any channel."""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -110,7 +110,7 @@ class InboundMessage:
     raw_event: Optional[Any] = None  # Original platform event
 
 
-@dataclass
+@dataclass(slots=True)
 class OutboundMessage:
     """A message to send to a channel."""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -122,7 +122,7 @@ class OutboundMessage:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class SendResult:
     """Result of sending a message."""
     success: bool
@@ -131,7 +131,7 @@ class SendResult:
     timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
 
 
-@dataclass
+@dataclass(slots=True)
 class AccessDecision:
     """Result of an access check."""
     allowed: bool
@@ -217,6 +217,24 @@ class ChannelAdapter(ABC):
         """Send a message to the channel."""
         ...
 
+    async def send_many(self, messages: List[OutboundMessage]) -> List[SendResult]:
+        """
+        Send a batch of messages in order.
+
+        The default implementation sends one at a time. Adapters whose
+        platform supports multi-send or frame batching can override this.
+        A send that raises yields a failed SendResult; the rest of the
+        batch is still sent.
+        """
+        results: List[SendResult] = []
+        for message in messages:
+            try:
+                results.append(await self.send(message))
+            except Exception as e:
+                logger.error(f"Send to {message.chat.chat_id} failed: {e}")
+                results.append(SendResult(success=False, error=str(e)))
+        return results
+
     async def send_text(self, chat_id: str, text: str, reply_to: Optional[str] = None) -> SendResult:
         """Convenience: send a text message."""
         return await self.send(OutboundMessage(
@@ -518,7 +518,8 @@ class ChatCommandHandler:
             return f"Context is already compact ({history_len // 2} turns). Nothing to compress."
 
         # Keep only the last 2 turns (4 messages) + flush pending learnings
-        mw_session.history = mw_session.history[-4:]
+        for _ in range(history_len - 4):
+            mw_session.history.popleft()
         self.middleware._flush_session(mw_session)
 
         removed = (history_len - 4) // 2
@@ -70,6 +70,9 @@ DEFAULT_ALLOCATION_WEIGHTS = {
     "graph": 0.10        # Relationships (usually compact)
 }
 
+# Importance level -> ranking score (matches the episodic importance CHECK)
+IMPORTANCE_SCORES = {"critical": 1.0, "high": 0.8, "normal": 0.5, "low": 0.2}
+
 # Minimum tokens per memory type (ensure some context from each)
 MIN_TOKENS_PER_TYPE = {
     "procedural": 500,
@@ -529,9 +532,7 @@ class ContextBudgetManager:
         score = 0.5
 
         # Check explicit importance field
-        importance = item.get("importance", "normal")
-        importance_map = {"critical": 1.0, "high": 0.8, "normal": 0.5, "low": 0.2}
-        score = importance_map.get(importance, 0.5)
+        score = IMPORTANCE_SCORES.get(item.get("importance", "normal"), 0.5)
 
         # Boost for frequently accessed/used
         access_count = item.get("access_count", 0) or item.get("usage_count", 0) or 0
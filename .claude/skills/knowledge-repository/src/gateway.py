@@ -25,13 +25,14 @@ import os
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
-from typing import Any, Callable, Coroutine, Dict, List, Optional
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Set, Tuple
 
 from channel_adapter import (
     ChannelAdapter,
     ChannelType,
     InboundMessage,
     OutboundMessage,
+    SendResult,
 )
 from memory_middleware import ArcusMiddleware, MiddlewareConfig
 
@@ -73,6 +74,15 @@ class GatewayConfig:
     session_reset_policy: str = "idle"  # Options: "idle", "daily", "manual"
     daily_reset_hour: int = 3  # Hour (0-23) for daily reset (UTC)
 
+    # Inbound concurrency
+    max_concurrent_messages: int = 64  # Messages processed in parallel
+
+    # Outbound delivery
+    outbound_queue_size: int = 1000  # Per-adapter outbox capacity (split across shards)
+    outbound_workers: int = 4  # Outbox shards (one send worker each) per adapter
+    outbound_batch_size: int = 64  # Max messages per send_many() call
+    outbound_batch_window_ms: float = 5.0  # Coalescing window for a batch
+
     @classmethod
     def from_env(cls) -> "GatewayConfig":
         """Load configuration from environment variables."""
@@ -93,6 +103,11 @@ class GatewayConfig:
             max_sessions=int(os.getenv("ARCUS_MAX_SESSIONS", "100")),
             session_reset_policy=os.getenv("ARCUS_SESSION_RESET_POLICY", "idle"),
             daily_reset_hour=int(os.getenv("ARCUS_DAILY_RESET_HOUR", "3")),
+            max_concurrent_messages=int(os.getenv("ARCUS_MAX_CONCURRENT_MESSAGES", "64")),
+            outbound_queue_size=int(os.getenv("ARCUS_OUTBOUND_QUEUE_SIZE", "1000")),
+            outbound_workers=int(os.getenv("ARCUS_OUTBOUND_WORKERS", "4")),
+            outbound_batch_size=int(os.getenv("ARCUS_OUTBOUND_BATCH_SIZE", "64")),
+            outbound_batch_window_ms=float(os.getenv("ARCUS_OUTBOUND_BATCH_WINDOW_MS", "5")),
         )
 
 
@@ -100,7 +115,7 @@ class GatewayConfig:
 # SESSION MANAGEMENT
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class GatewaySession:
     """Tracks a conversation session across channels."""
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -125,6 +140,10 @@ class GatewaySession:
         self.message_count += 1
 
 
+# (channel, user_id, chat_id)
+SessionKey = Tuple[ChannelType, str, str]
+
+
 class SessionManager:
     """Manages gateway sessions with automatic cleanup and reset policies."""
 
@@ -136,15 +155,17 @@ class SessionManager:
         daily_reset_hour: int = 3
     ):
         self._sessions: Dict[str, GatewaySession] = {}
-        self._user_sessions: Dict[str, str] = {}  # user_key -> session_id
+        self._user_sessions: Dict[SessionKey, str] = {}  # user_key -> session_id
         self.max_sessions = max_sessions
         self.timeout_minutes = timeout_minutes
         self.reset_policy = reset_policy
         self.daily_reset_hour = daily_reset_hour
         self._last_daily_reset: Optional[datetime] = None
 
-    def _user_key(self, user_id: str, channel: ChannelType, chat_id: str) -> str:
-        return f"{channel.value}:{user_id}:{chat_id}"
+    @staticmethod
+    def _user_key(user_id: str, channel: ChannelType, chat_id: str) -> SessionKey:
+        # Tuple key: hashed directly, no per-message string formatting
+        return (channel, user_id, chat_id)
 
     def get_or_create(
         self, user_id: str, channel: ChannelType, chat_id: str
@@ -153,15 +174,14 @@ class SessionManager:
         key = self._user_key(user_id, channel, chat_id)
 
         # Return existing if active
-        if key in self._user_sessions:
-            session_id = self._user_sessions[key]
+        session_id = self._user_sessions.get(key)
+        if session_id is not None:
             session = self._sessions.get(session_id)
             if session and not session.is_expired:
                 session.touch()
                 return session
             # Clean up expired
-            if session_id in self._sessions:
-                del self._sessions[session_id]
+            self._sessions.pop(session_id, None)
             del self._user_sessions[key]
 
         # Enforce limit
@@ -177,7 +197,7 @@ class SessionManager:
         )
         self._sessions[session.id] = session
         self._user_sessions[key] = session.id
-        logger.info(f"New session {session.id[:8]} for {key}")
+        logger.info(f"New session {session.id[:8]} for {channel.value}:{user_id}:{chat_id}")
         return session
 
     def end(self, session_id: str) -> Optional[GatewaySession]:
@@ -239,7 +259,7 @@ class SessionManager:
 # EVENT SYSTEM
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class GatewayEvent:
     """An event emitted by the gateway."""
     type: str               # e.g., "message.received", "session.created"
@@ -541,6 +561,20 @@ class ArcusGateway:
 
         self.processor = MessageProcessor(self.config, self.middleware)
         self._adapters: Dict[str, ChannelAdapter] = {}
+        # Outbound delivery: bounded outboxes per adapter, each drained by its
+        # own send worker so slow sends never block inbound handling. A chat
+        # always maps to the same shard, so its responses go out in order.
+        # Each item is the list of messages making up one response.
+        self._outboxes: Dict[str, List[asyncio.Queue]] = {}
+        self._send_workers: List[asyncio.Task] = []
+        # Inbound messages are processed in background tasks so adapters can
+        # read the next frame immediately; the semaphore caps concurrency.
+        # Messages from one chat run one at a time, in arrival order, under
+        # a per-chat lock that is dropped once no message for it is waiting.
+        self._inbound_limit = asyncio.Semaphore(max(1, self.config.max_concurrent_messages))
+        self._inbound_tasks: Set[asyncio.Task] = set()
+        self._chat_locks: Dict[Tuple[str, str], asyncio.Lock] = {}
+        self._chat_waiters: Dict[Tuple[str, str], int] = {}
         self._running = False
         self._command_handler: Optional[Callable] = None
 
@@ -551,6 +585,9 @@ class ArcusGateway:
     def register_adapter(self, adapter: ChannelAdapter) -> None:
         """Register a channel adapter with the gateway."""
         self._adapters[adapter.name] = adapter
+        shards = max(1, self.config.outbound_workers)
+        shard_size = max(1, self.config.outbound_queue_size // shards)
+        self._outboxes[adapter.name] = [asyncio.Queue(maxsize=shard_size) for _ in range(shards)]
         adapter.on_message(self._handle_inbound)
         # Wire reaction handlers to middleware
         adapter.on_reaction(self._handle_reaction)
@@ -597,6 +634,13 @@ class ArcusGateway:
             except Exception as e:
                 logger.error(f"  ✗ {name} failed to connect: {e}", exc_info=True)
 
+        # Start outbound send workers, one per outbox shard
+        for name, adapter in self._adapters.items():
+            for outbox in self._outboxes[name]:
+                self._send_workers.append(asyncio.create_task(
+                    self._send_worker(adapter, outbox)
+                ))
+
         await self.events.emit(GatewayEvent(
             type="gateway.started",
             data={"adapters": list(self._adapters.keys())},
@@ -609,11 +653,20 @@ class ArcusGateway:
         logger.info("Stopping Arcus Gateway...")
         self._running = False
 
+        # Cancel in-flight message processing
+        for task in list(self._inbound_tasks):
+            task.cancel()
+        await asyncio.gather(*self._inbound_tasks, return_exceptions=True)
+
+        # Give queued responses a chance to go out, then stop the workers
+        await self._drain_outboxes()
+
         # Flush all middleware sessions
         for key in list(self.middleware._sessions.keys()):
             session = self.middleware._sessions.get(key)
             if session:
                 self.middleware._flush_session(session)
+        self.middleware.audit.flush()
 
         for name, adapter in self._adapters.items():
             try:
@@ -633,6 +686,51 @@ class ArcusGateway:
         """
         Central message handler — called by all adapters.
 
+        Schedules processing in a background task and returns immediately,
+        so a slow model call never blocks the adapter's receive loop.
+        """
+        if not self._running:
+            return
+
+        if self._inbound_limit.locked():
+            logger.debug("Inbound concurrency limit reached, message will wait")
+
+        task = asyncio.create_task(self._process_inbound(message))
+        self._inbound_tasks.add(task)
+        task.add_done_callback(self._inbound_tasks.discard)
+
+    async def _process_inbound(self, message: InboundMessage) -> None:
+        """
+        Run the message pipeline, bounded by max_concurrent_messages.
+
+        The chat lock is taken before any await, so messages from the same
+        chat are handled in the order their tasks were created (asyncio.Lock
+        wakes waiters FIFO); only different chats run concurrently.
+        """
+        key = (message.channel.value, message.chat.chat_id)
+        lock = self._chat_locks.get(key)
+        if lock is None:
+            lock = self._chat_locks[key] = asyncio.Lock()
+        self._chat_waiters[key] = self._chat_waiters.get(key, 0) + 1
+        try:
+            async with lock:
+                async with self._inbound_limit:
+                    try:
+                        await self._handle_message(message)
+                    except Exception as e:
+                        logger.error(f"Inbound handling failed: {e}", exc_info=True)
+        finally:
+            remaining = self._chat_waiters[key] - 1
+            if remaining:
+                self._chat_waiters[key] = remaining
+            else:
+                del self._chat_waiters[key]
+                del self._chat_locks[key]
+
+    async def _handle_message(self, message: InboundMessage) -> None:
+        """
+        Process a single inbound message.
+
         Flow:
         1. Resolve cross-channel identity
         2. Get or create session
@@ -737,7 +835,7 @@ class ArcusGateway:
             asyncio.create_task(adapter._send_typing(message.chat.chat_id))
 
     async def _send_response(self, original: InboundMessage, text: str) -> None:
-        """Send a response back through the originating channel, chunking if needed."""
+        """Queue a response for the originating channel, chunking if needed."""
         adapter = self._adapters.get(original.channel.value)
         if not adapter:
             for a in self._adapters.values():
@@ -753,23 +851,117 @@ class ArcusGateway:
         max_len = 4096 if original.channel == ChannelType.WHATSAPP else 0
         if max_len and len(text) > max_len:
             chunks = [text[i:i + max_len] for i in range(0, len(text), max_len)]
-            for chunk in chunks:
-                result = await adapter.send(OutboundMessage(
-                    text=chunk,
-                    chat=original.chat,
-                    reply_to_id=original.id,
-                ))
+        else:
+            chunks = [text]
+
+        job = [
+            OutboundMessage(text=chunk, chat=original.chat, reply_to_id=original.id)
+            for chunk in chunks
+        ]
+
+        # Same chat -> same shard -> same worker, so per-chat order holds
+        shards = self._outboxes[adapter.name]
+        outbox = shards[hash(original.chat.chat_id) % len(shards)]
+        try:
+            outbox.put_nowait(job)
+        except asyncio.QueueFull:
+            # Backpressure: wait for a worker to free a slot
+            logger.warning(f"Outbox full for {adapter.name}, waiting to enqueue")
+            await outbox.put(job)
+
+    async def _send_worker(self, adapter: ChannelAdapter, outbox: asyncio.Queue) -> None:
+        """
+        Drain one outbox shard in coalesced batches.
+
+        Waits for the first queued response, then collects whatever else is
+        already queued (yielding to the loop once when the outbox runs dry)
+        for up to outbound_batch_window_ms or outbound_batch_size messages.
+        Responses are sent in queue order; since each chat maps to a single
+        shard, a chat's responses never overtake each other. Uses
+        get_nowait() rather than wait_for(get()) so no timer handle is
+        created per item.
+        """
+        loop = asyncio.get_running_loop()
+        max_batch = max(1, self.config.outbound_batch_size)
+        window = self.config.outbound_batch_window_ms / 1000.0
+
+        while True:
+            jobs = [await outbox.get()]
+            size = len(jobs[0])
+            deadline = loop.time() + window
+            yielded = False
+            while size < max_batch and loop.time() < deadline:
+                try:
+                    job = outbox.get_nowait()
+                except asyncio.QueueEmpty:
+                    # Give producers one chance to enqueue, then send
+                    if yielded:
+                        break
+                    yielded = True
+                    await asyncio.sleep(0)
+                    continue
+                yielded = False
+                jobs.append(job)
+                size += len(job)
+
+            try:
+                await self._send_jobs(adapter, jobs)
+            except Exception as e:
+                logger.error(f"Send worker error on {adapter.name}: {e}", exc_info=True)
+            finally:
+                for _ in jobs:
+                    outbox.task_done()
+
+    async def _send_jobs(self, adapter: ChannelAdapter, jobs: List[List[OutboundMessage]]) -> None:
+        """
+        Send queued responses in order.
+
+        Runs of single-message responses go out together through one
+        send_many() call. A chunked response is sent chunk by chunk, and its
+        remaining chunks are skipped once one fails.
+        """
+        singles: List[OutboundMessage] = []
+        for job in jobs:
+            if len(job) == 1:
+                singles.append(job[0])
+                continue
+            if singles:
+                await self._send_batch(adapter, singles)
+                singles = []
+            for chunk in job:
+                try:
+                    result = await adapter.send(chunk)
+                except Exception as e:
+                    result = SendResult(success=False, error=str(e))
                 if not result.success:
-                    logger.error(f"Failed to send chunk: {result.error}")
+                    logger.error(f"Failed to send response on {adapter.name}: {result.error}")
                     break
-        else:
-            result = await adapter.send(OutboundMessage(
-                text=text,
-                chat=original.chat,
-                reply_to_id=original.id,
-            ))
+        if singles:
+            await self._send_batch(adapter, singles)
+
+    async def _send_batch(self, adapter: ChannelAdapter, messages: List[OutboundMessage]) -> None:
+        """send_many() a batch of single-message responses, logging failures."""
+        for result in await adapter.send_many(messages):
             if not result.success:
-                logger.error(f"Failed to send response: {result.error}")
+                logger.error(f"Failed to send response on {adapter.name}: {result.error}")
+
+    async def _drain_outboxes(self, timeout: float = 5.0) -> None:
+        """Wait (bounded) for pending responses to be sent, then cancel workers."""
+        outboxes = [q for shards in self._outboxes.values() for q in shards]
+        if outboxes:
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(*(q.join() for q in outboxes)),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                pending = sum(q.qsize() for q in outboxes)
+                logger.warning(f"Dropping {pending} unsent response(s) on shutdown")
+
+        for task in self._send_workers:
+            task.cancel()
+        await asyncio.gather(*self._send_workers, return_exceptions=True)
+        self._send_workers.clear()
 
     # -------------------------------------------------------------------------
     # Status & info
@@ -792,6 +984,9 @@ class ArcusGateway:
                 "active": len(self.sessions.list_active()),
                 "max": self.config.max_sessions,
             },
+            "outbound_pending": {
+                name: sum(q.qsize() for q in shards) for name, shards in self._outboxes.items()
+            },
             "middleware": middleware_status,
             "config": {
                 "memory_injection": self.config.memory_injection_enabled,
@@ -46,6 +46,8 @@ import logging
 import os
 import signal
 import sys
+from dataclasses import dataclass
+from typing import FrozenSet, Optional, Tuple
 
 # Add src directory to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
@@ -73,95 +75,164 @@ def setup_logging() -> None:
     logging.getLogger("aiohttp").setLevel(logging.WARNING)
 
 
+# =============================================================================
+# ENVIRONMENT SNAPSHOT
+# =============================================================================
+
+def _split_csv(value: str) -> Tuple[str, ...]:
+    """Split a comma-separated env value into a tuple of non-empty entries."""
+    return tuple(s.strip() for s in value.split(",") if s.strip())
+
+
+def _env_flag(name: str, default: str) -> bool:
+    """Read a boolean env var ("true"/"false")."""
+    return os.getenv(name, default).lower() == "true"
+
+
+@dataclass(frozen=True)
+class EnvSnapshot:
+    """
+    Immutable snapshot of the adapter-related environment.
+
+    Read once in main() so every adapter factory sees the same values (no
+    mid-start env races) and reloads only need to build a new snapshot.
+    Comma-separated lists are split here rather than in each factory.
+    """
+    # Gateway
+    gateway_host: str = "0.0.0.0"
+    gateway_ws_port: int = 18790
+    gateway_http_port: int = 8080
+    adapters: Optional[FrozenSet[str]] = None  # None = all adapters
+    production: bool = False
+
+    # WebSocket
+    websocket_enabled: bool = True
+    websocket_pairing: bool = False
+
+    # WhatsApp
+    whatsapp_bridge_url: str = ""
+    whatsapp_allowlist: Tuple[str, ...] = ()
+    whatsapp_read_receipts: bool = True
+    whatsapp_typing_indicator: bool = True
+
+    # Discord
+    discord_bot_token: str = ""
+    discord_guild_ids: Tuple[str, ...] = ()
+    discord_require_mention: bool = False
+    discord_respond_dms: bool = True
+
+    # Siri
+    siri_api_secret: str = ""
+    siri_allowed_devices: Tuple[str, ...] = ()
+    siri_webhook_path: str = "/webhook/siri"
+    siri_max_response_length: int = 500
+
+    @classmethod
+    def load(cls) -> "EnvSnapshot":
+        """Parse all adapter environment variables once."""
+        adapters_filter = os.getenv("ARCUS_ADAPTERS", "").lower()
+        return cls(
+            gateway_host=os.getenv("ARCUS_GATEWAY_HOST", "0.0.0.0"),
+            gateway_ws_port=int(os.getenv("ARCUS_GATEWAY_WS_PORT", "18790")),
+            gateway_http_port=int(os.getenv("ARCUS_GATEWAY_HTTP_PORT", "8080")),
+            adapters=frozenset(adapters_filter.split(",")) if adapters_filter else None,
+            production=os.getenv("NODE_ENV") == "production",
+            websocket_enabled=os.getenv("ARCUS_WEBSOCKET_ENABLED", "true").lower() != "false",
+            websocket_pairing=_env_flag("ARCUS_WEBSOCKET_PAIRING", "false"),
+            whatsapp_bridge_url=os.getenv("WHATSAPP_BRIDGE_URL", ""),
+            whatsapp_allowlist=_split_csv(os.getenv("WHATSAPP_ALLOWLIST", "")),
+            whatsapp_read_receipts=_env_flag("WHATSAPP_READ_RECEIPTS", "true"),
+            whatsapp_typing_indicator=_env_flag("WHATSAPP_TYPING_INDICATOR", "true"),
+            discord_bot_token=os.getenv("DISCORD_BOT_TOKEN", ""),
+            discord_guild_ids=_split_csv(os.getenv("DISCORD_GUILD_IDS", "")),
+            discord_require_mention=_env_flag("DISCORD_REQUIRE_MENTION", "false"),
+            discord_respond_dms=_env_flag("DISCORD_RESPOND_DMS", "true"),
+            siri_api_secret=os.getenv("SIRI_API_SECRET", os.getenv("API_SECRET_KEY", "")),
+            siri_allowed_devices=_split_csv(os.getenv("SIRI_ALLOWED_DEVICES", "")),
+            siri_webhook_path=os.getenv("SIRI_WEBHOOK_PATH", "/webhook/siri"),
+            siri_max_response_length=int(os.getenv("SIRI_MAX_RESPONSE_LENGTH", "500")),
+        )
+
+
 # =============================================================================
 # ADAPTER FACTORIES
 # =============================================================================
 
-def create_whatsapp_adapter():
+def create_whatsapp_adapter(env: EnvSnapshot):
     """Create WhatsApp adapter if configured."""
-    bridge_url = os.getenv("WHATSAPP_BRIDGE_URL")
-    if not bridge_url:
+    if not env.whatsapp_bridge_url:
         return None
 
     from adapter_whatsapp import WhatsAppAdapter
 
-    allowlist_str = os.getenv("WHATSAPP_ALLOWLIST", "")
-    allowlist = [s.strip() for s in allowlist_str.split(",") if s.strip()]
-
+    allowlist = list(env.whatsapp_allowlist)
     policy = AccessPolicy.ALLOWLIST if allowlist else AccessPolicy.OPEN
 
     return WhatsAppAdapter(
-        bridge_url=bridge_url,
+        bridge_url=env.whatsapp_bridge_url,
         access_policy=policy,
         allowlist=allowlist,
-        send_read_receipts=os.getenv("WHATSAPP_READ_RECEIPTS", "true").lower() == "true",
-        send_typing_indicator=os.getenv("WHATSAPP_TYPING_INDICATOR", "true").lower() == "true",
+        send_read_receipts=env.whatsapp_read_receipts,
+        send_typing_indicator=env.whatsapp_typing_indicator,
     )
 
 
-def create_discord_adapter():
+def create_discord_adapter(env: EnvSnapshot):
     """Create Discord adapter if configured."""
-    bot_token = os.getenv("DISCORD_BOT_TOKEN")
-    if not bot_token:
+    if not env.discord_bot_token:
         return None
 
     from adapter_discord import DiscordAdapter
 
-    guild_ids_str = os.getenv("DISCORD_GUILD_IDS", "")
-    guild_ids = [s.strip() for s in guild_ids_str.split(",") if s.strip()]
-
+    guild_ids = list(env.discord_guild_ids)
     policy = AccessPolicy.ALLOWLIST if guild_ids else AccessPolicy.OPEN
 
     return DiscordAdapter(
-        bot_token=bot_token,
+        bot_token=env.discord_bot_token,
         access_policy=policy,
         allowlist_guild_ids=guild_ids,
-        require_mention=os.getenv("DISCORD_REQUIRE_MENTION", "false").lower() == "true",
-        respond_to_dms=os.getenv("DISCORD_RESPOND_DMS", "true").lower() == "true",
+        require_mention=env.discord_require_mention,
+        respond_to_dms=env.discord_respond_dms,
     )
 
 
-def create_siri_adapter():
+def create_siri_adapter(env: EnvSnapshot):
     """Create Siri webhook adapter if configured."""
-    api_secret = os.getenv("SIRI_API_SECRET", os.getenv("API_SECRET_KEY", ""))
-    if not api_secret:
+    if not env.siri_api_secret:
         # Siri adapter can run without auth in development
-        if os.getenv("NODE_ENV") == "production":
+        if env.production:
             return None
 
     from adapter_siri import SiriWebhookAdapter
 
-    devices_str = os.getenv("SIRI_ALLOWED_DEVICES", "")
-    devices = [s.strip() for s in devices_str.split(",") if s.strip()]
-
+    devices = list(env.siri_allowed_devices)
     policy = AccessPolicy.ALLOWLIST if devices else AccessPolicy.OPEN
 
     return SiriWebhookAdapter(
-        api_secret=api_secret,
-        host=os.getenv("ARCUS_GATEWAY_HOST", "0.0.0.0"),
-        port=int(os.getenv("ARCUS_GATEWAY_HTTP_PORT", "8080")),
-        path=os.getenv("SIRI_WEBHOOK_PATH", "/webhook/siri"),
+        api_secret=env.siri_api_secret,
+        host=env.gateway_host,
+        port=env.gateway_http_port,
+        path=env.siri_webhook_path,
         access_policy=policy,
         allowed_device_ids=devices,
-        max_response_length=int(os.getenv("SIRI_MAX_RESPONSE_LENGTH", "500")),
+        max_response_length=env.siri_max_response_length,
     )
 
 
-def create_websocket_adapter():
+def create_websocket_adapter(env: EnvSnapshot):
     """Create WebSocket adapter (always enabled)."""
     from adapter_websocket import WebSocketAdapter
 
     # Check if explicitly disabled
-    if os.getenv("ARCUS_WEBSOCKET_ENABLED", "true").lower() == "false":
+    if not env.websocket_enabled:
         return None
 
     # Get pairing policy if configured
-    use_pairing = os.getenv("ARCUS_WEBSOCKET_PAIRING", "false").lower() == "true"
-    policy = AccessPolicy.PAIRING if use_pairing else AccessPolicy.OPEN
+    policy = AccessPolicy.PAIRING if env.websocket_pairing else AccessPolicy.OPEN
 
     return WebSocketAdapter(
-        host=os.getenv("ARCUS_GATEWAY_HOST", "0.0.0.0"),
-        port=int(os.getenv("ARCUS_GATEWAY_WS_PORT", "18790")),
+        host=env.gateway_host,
+        port=env.gateway_ws_port,
         access_policy=policy,
     )
 
@@ -191,9 +262,9 @@ async def main() -> None:
     commands.set_session_end_callback(gateway.sessions.end)
     gateway.set_command_handler(commands.handle)
 
-    # Determine which adapters to load
-    adapters_filter = os.getenv("ARCUS_ADAPTERS", "").lower()
-    enabled = set(adapters_filter.split(",")) if adapters_filter else None
+    # Snapshot adapter env once; factories read from it instead of os.getenv
+    env = EnvSnapshot.load()
+    enabled = env.adapters
 
     # Register adapters
     adapter_factories = {
@@ -209,7 +280,7 @@ async def main() -> None:
             logger.info(f"  Skipping {name} (not in ARCUS_ADAPTERS)")
             continue
         try:
-            adapter = factory()
+            adapter = factory(env)
             if adapter:
                 gateway.register_adapter(adapter)
                 registered += 1
@@ -232,8 +303,8 @@ async def main() -> None:
         from adapter_siri import SiriWebhookAdapter
         siri = SiriWebhookAdapter(
             api_secret="",
-            host=os.getenv("ARCUS_GATEWAY_HOST", "0.0.0.0"),
-            port=int(os.getenv("ARCUS_GATEWAY_HTTP_PORT", "8080")),
+            host=env.gateway_host,
+            port=env.gateway_http_port,
             access_policy=AccessPolicy.OPEN,
         )
         gateway.register_adapter(siri)
@@ -254,17 +325,18 @@ async def main() -> None:
     logger.info(f"WebSocket port: {config.ws_port}")
     logger.info("\nGateway is running. Press Ctrl+C to stop.\n")
 
-    # Wait for shutdown signal
-    stop_event = asyncio.Event()
+    # Wait for shutdown signal (a single future resolved by the handler)
+    loop = asyncio.get_running_loop()
+    stop_future = loop.create_future()
 
     def _signal_handler():
-        stop_event.set()
+        if not stop_future.done():
+            stop_future.set_result(None)
 
-    loop = asyncio.get_running_loop()
     for sig in (signal.SIGINT, signal.SIGTERM):
         loop.add_signal_handler(sig, _signal_handler)
 
-    await stop_event.wait()
+    await stop_future
 
     # Graceful shutdown
     logger.info("\nShutting down...")
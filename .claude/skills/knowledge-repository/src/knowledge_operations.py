@@ -23,12 +23,40 @@ Usage:
     insights = repo.reflect(days=30)
 """
 
+import asyncio
+import functools
 import json
+import logging
+import math
+import operator
 import os
+import re
+import sys
+import threading
+import time
+from collections import Counter, OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional
-from dataclasses import dataclass, asdict
-from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+from dataclasses import dataclass, asdict, field
+from enum import Enum, IntEnum
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+logger = logging.getLogger("arcus.knowledge")
+
+
+def dumps_json(obj: Any, indent: bool = False) -> str:
+    """Serialize to JSON, using orjson when installed (stdlib json otherwise)."""
+    if orjson is not None:
+        option = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_DATACLASS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option, default=str).decode()
+    return json.dumps(obj, indent=2 if indent else None, default=str)
 
 
 # =============================================================================
@@ -42,7 +70,10 @@ class MemoryType(Enum):
     GRAPH = "graph"
 
 
-class EventType(Enum):
+# Enums serialized by to_dict() mix in str: members are their own value, so
+# they are stored as-is and JSON-encode as plain strings
+
+class EventType(str, Enum):
     CONVERSATION = "conversation"
     DECISION = "decision"
     MEETING = "meeting"
@@ -53,7 +84,7 @@ class EventType(Enum):
     CORRECTION = "correction"
 
 
-class SemanticCategory(Enum):
+class SemanticCategory(str, Enum):
     FACT = "fact"
     PATTERN = "pattern"
     FRAMEWORK = "framework"
@@ -63,7 +94,7 @@ class SemanticCategory(Enum):
     PREFERENCE = "preference"
 
 
-class ProcedureType(Enum):
+class ProcedureType(str, Enum):
     WORKFLOW = "workflow"
     PREFERENCE = "preference"
     STANDARD = "standard"
@@ -72,13 +103,13 @@ class ProcedureType(Enum):
     TOOL_PATTERN = "tool_pattern"  # NEW: For model/tool usage patterns
 
 
-class TaskComplexity(Enum):
+class TaskComplexity(str, Enum):
     LOW = "low"
     MEDIUM = "medium"
     HIGH = "high"
 
 
-class PatternOutcome(Enum):
+class PatternOutcome(str, Enum):
     SUCCESS = "success"
     PARTIAL = "partial"
     FAILURE = "failure"
@@ -91,7 +122,7 @@ class ThinkingLevel(Enum):
     HIGH = "high"
 
 
-class SourceType(Enum):
+class SourceType(str, Enum):
     USER_EXPLICIT = "user_explicit"
     USER_IMPLICIT = "user_implicit"
     EXTRACTION = "extraction"
@@ -100,11 +131,70 @@ class SourceType(Enum):
     SYSTEM = "system"
 
 
+class Importance(IntEnum):
+    """Episodic importance; ordered so ranking can compare levels as ints."""
+    LOW = 0
+    NORMAL = 1
+    HIGH = 2
+    CRITICAL = 3
+
+
+# Stored (TEXT) form of each Importance level, indexed by its int value
+_IMPORTANCE_LABELS = ("low", "normal", "high", "critical")
+
+
 # =============================================================================
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+# Low-cardinality label fields (entity/relationship types, domains, tool
+# names) are sys.intern()ed in __post_init__ so repeated labels share one
+# string object and compare by identity.
+
+# Shared stand-in for unset list fields in to_dict(): an immutable empty
+# tuple serializes as [] without allocating a new list per call. Dict
+# fields keep a fresh {} because JSON encoders reject read-only mappings;
+# an unset source still serializes as {} (not omitted) since multi-row
+# inserts need identical keys on every row and source is NOT NULL.
+_EMPTY_LIST: Tuple[()] = ()
+
+
+def _weighted_score(
+    accuracy: float,
+    cost: float,
+    latency: float,
+    accuracy_weight: float,
+    cost_weight: float,
+    latency_weight: float,
+    max_cost: float,
+    max_latency: float
+) -> float:
+    """Preference-weighted score kernel shared by the scoring methods."""
+    # Normalize cost and latency (invert so lower is better); conditional
+    # expressions clamp without a min() call
+    cost_ratio = cost / max_cost
+    latency_ratio = latency / max_latency
+    cost_normalized = 1.0 - cost_ratio if cost_ratio < 1.0 else 0.0
+    latency_normalized = 1.0 - latency_ratio if latency_ratio < 1.0 else 0.0
+
+    return (
+        accuracy * accuracy_weight +
+        cost_normalized * cost_weight +
+        latency_normalized * latency_weight
+    )
+
+
+def _utc_timestamp() -> str:
+    """Current UTC time in ISO format."""
+    return datetime.utcnow().isoformat()
+
+
+def _utc_cutoff(days: int) -> str:
+    """UTC time N days ago in ISO format."""
+    return (datetime.utcnow() - timedelta(days=days)).isoformat()
+
+
+@dataclass(slots=True, frozen=True)
 class KnowledgeSource:
     """Tracks where knowledge came from."""
     type: SourceType
@@ -112,18 +202,43 @@ class KnowledgeSource:
     interaction_id: Optional[str] = None
     document_ref: Optional[str] = None
     note: Optional[str] = None
+    # Serialized form, built on first to_dict(). Frozen because get() shares
+    # instances; to_dict() hands out copies so rows can't alter the cache.
+    _dict: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def get(
+        cls,
+        type: SourceType,
+        session_id: Optional[str] = None,
+        interaction_id: Optional[str] = None,
+        document_ref: Optional[str] = None,
+        note: Optional[str] = None
+    ) -> "KnowledgeSource":
+        """
+        Shared instance for this provenance.
+
+        Entries from the same session/interaction reuse one (frozen) source
+        object instead of each holding a copy; its dict is built once.
+        """
+        return cls(type, session_id, interaction_id, document_ref, note)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
-            "type": self.type.value,
-            "session_id": self.session_id,
-            "interaction_id": self.interaction_id,
-            "document_ref": self.document_ref,
-            "note": self.note
-        }
+        if self._dict is None:
+            object.__setattr__(self, "_dict", {
+                "type": self.type,
+                "session_id": self.session_id,
+                "interaction_id": self.interaction_id,
+                "document_ref": self.document_ref,
+                "note": self.note
+            })
+        return self._dict.copy()
 
 
-@dataclass
+@dataclass(slots=True)
 class EpisodicEntry:
     """An episodic memory entry (what happened)."""
     event_type: EventType
@@ -132,24 +247,37 @@ class EpisodicEntry:
     outcome: Optional[str] = None
     learnings: Optional[List[str]] = None
     confidence: float = 0.8
-    importance: str = "normal"
+    importance: Importance = Importance.NORMAL
     source: Optional[KnowledgeSource] = None
+    # Captured at construction so to_dict() is a pure read
+    event_timestamp: str = field(default_factory=_utc_timestamp)
+
+    def __post_init__(self):
+        # Accept the stored text form ("low", "high", ...) as well
+        if isinstance(self.importance, str):
+            try:
+                self.importance = Importance[self.importance.upper()]
+            except KeyError:
+                raise ValueError(
+                    f"Unknown importance {self.importance!r}; "
+                    f"expected one of {', '.join(_IMPORTANCE_LABELS)}"
+                ) from None
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "event_type": self.event_type.value,
+            "event_type": self.event_type,
             "summary": self.summary,
             "participants": self.participants,
             "outcome": self.outcome,
-            "learnings": self.learnings or [],
+            "learnings": self.learnings or _EMPTY_LIST,
             "confidence": self.confidence,
-            "importance": self.importance,
-            "source": self.source.to_dict() if self.source else {},
-            "event_timestamp": datetime.utcnow().isoformat()
+            "importance": _IMPORTANCE_LABELS[self.importance],
+            "source": {} if self.source is None else self.source.to_dict(),
+            "event_timestamp": self.event_timestamp
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SemanticEntry:
     """A semantic memory entry (what we know)."""
     category: SemanticCategory
@@ -159,18 +287,22 @@ class SemanticEntry:
     confidence: float = 0.8
     source: Optional[KnowledgeSource] = None
 
+    def __post_init__(self):
+        if self.domain is not None:
+            self.domain = sys.intern(self.domain)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "category": self.category.value,
+            "category": self.category,
             "statement": self.statement,
             "domain": self.domain,
-            "evidence": self.evidence or [],
+            "evidence": self.evidence or _EMPTY_LIST,
             "confidence": self.confidence,
-            "source": self.source.to_dict() if self.source else {}
+            "source": {} if self.source is None else self.source.to_dict()
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ProceduralEntry:
     """A procedural memory entry (how we work)."""
     procedure_type: ProcedureType
@@ -183,17 +315,17 @@ class ProceduralEntry:
 
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "procedure_type": self.procedure_type.value,
+            "procedure_type": self.procedure_type,
             "name": self.name,
             "description": self.description,
             "preference_value": self.preference_value,
-            "trigger_conditions": self.trigger_conditions or [],
+            "trigger_conditions": self.trigger_conditions or _EMPTY_LIST,
             "confidence": self.confidence,
-            "source": self.source.to_dict() if self.source else {}
+            "source": {} if self.source is None else self.source.to_dict()
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class EntityEntry:
     """A knowledge graph entity."""
     entity_type: str
@@ -204,19 +336,22 @@ class EntityEntry:
     confidence: float = 0.8
     source: Optional[KnowledgeSource] = None
 
+    def __post_init__(self):
+        self.entity_type = sys.intern(self.entity_type)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "entity_type": self.entity_type,
             "name": self.name,
             "description": self.description,
             "attributes": self.attributes or {},
-            "aliases": self.aliases or [],
+            "aliases": self.aliases or _EMPTY_LIST,
             "confidence": self.confidence,
-            "source": self.source.to_dict() if self.source else {}
+            "source": {} if self.source is None else self.source.to_dict()
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class RelationshipEntry:
     """A knowledge graph relationship."""
     source_type: str
@@ -228,6 +363,11 @@ class RelationshipEntry:
     confidence: float = 0.8
     source: Optional[KnowledgeSource] = None
 
+    def __post_init__(self):
+        self.source_type = sys.intern(self.source_type)
+        self.relationship = sys.intern(self.relationship)
+        self.target_type = sys.intern(self.target_type)
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "source_type": self.source_type,
@@ -237,30 +377,36 @@ class RelationshipEntry:
             "target_name": self.target_name,
             "properties": self.properties or {},
             "confidence": self.confidence,
-            "source": self.source.to_dict() if self.source else {}
+            "source": {} if self.source is None else self.source.to_dict()
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ToolInvocation:
     """Record of a tool invocation within an orchestration."""
     name: str
     success: bool
     latency_ms: Optional[int] = None
     cost: Optional[float] = None
-    params_hash: Optional[str] = None
+    # Raw digest bytes (e.g. hashlib ...digest()) are preferred over hex
+    # strings: half the size in memory. Serialized as hex either way.
+    params_hash: Optional[Union[bytes, str]] = None
+
+    def __post_init__(self):
+        self.name = sys.intern(self.name)
 
     def to_dict(self) -> Dict[str, Any]:
+        params_hash = self.params_hash
         return {
             "name": self.name,
             "success": self.success,
             "latency_ms": self.latency_ms,
             "cost": self.cost,
-            "params_hash": self.params_hash
+            "params_hash": params_hash.hex() if isinstance(params_hash, bytes) else params_hash
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ModelPatternEntry:
     """A model/tool usage pattern (ToolOrchestra-inspired)."""
     task_context: str
@@ -275,25 +421,36 @@ class ModelPatternEntry:
     user_preference_context: Optional[str] = None
     confidence: float = 0.5
     source: Optional[KnowledgeSource] = None
+    # Serialized tools_sequence, built on first to_dict(). Entries are
+    # treated as immutable once built: don't mutate tools_sequence after
+    # serializing.
+    _tools_dicts: Optional[Sequence[Dict[str, Any]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
+        if self._tools_dicts is None:
+            self._tools_dicts = (
+                [t.to_dict() for t in self.tools_sequence]
+                if self.tools_sequence else _EMPTY_LIST
+            )
         return {
             "task_context": self.task_context,
             "model_used": self.model_used,
-            "outcome": self.outcome.value,
-            "task_complexity": self.task_complexity.value,
-            "tools_sequence": [t.to_dict() for t in (self.tools_sequence or [])],
+            "outcome": self.outcome,
+            "task_complexity": self.task_complexity,
+            "tools_sequence": self._tools_dicts,
             "accuracy_score": self.accuracy_score,
             "total_cost_usd": self.total_cost_usd,
             "total_latency_ms": self.total_latency_ms,
             "tokens_used": self.tokens_used,
             "user_preference_context": self.user_preference_context,
             "confidence": self.confidence,
-            "source": self.source.to_dict() if self.source else {}
+            "source": {} if self.source is None else self.source.to_dict()
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class UserPreferenceVectorEntry:
     """User preference vector for orchestration (ToolOrchestra-inspired)."""
     context_name: str
@@ -307,6 +464,17 @@ class UserPreferenceVectorEntry:
     overrides: Optional[Dict[str, Dict[str, float]]] = None
     source: Optional[KnowledgeSource] = None
 
+    def __post_init__(self):
+        # Resolve unset maps once so lookups never need an `or {}` fallback
+        if self.model_preferences is None:
+            self.model_preferences = {}
+        if self.tool_preferences is None:
+            self.tool_preferences = {}
+        if self.skill_preferences is None:
+            self.skill_preferences = {}
+        if self.overrides is None:
+            self.overrides = {}
+
     def to_dict(self) -> Dict[str, Any]:
         return {
             "user_id": self.user_id,
@@ -314,20 +482,20 @@ class UserPreferenceVectorEntry:
             "accuracy_weight": self.accuracy_weight,
             "cost_weight": self.cost_weight,
             "latency_weight": self.latency_weight,
-            "model_preferences": self.model_preferences or {},
-            "tool_preferences": self.tool_preferences or {},
-            "skill_preferences": self.skill_preferences or {},
-            "overrides": self.overrides or {},
-            "source": self.source.to_dict() if self.source else {}
+            "model_preferences": self.model_preferences,
+            "tool_preferences": self.tool_preferences,
+            "skill_preferences": self.skill_preferences,
+            "overrides": self.overrides,
+            "source": {} if self.source is None else self.source.to_dict()
         }
 
     def get_model_preference(self, model: str) -> float:
         """Get preference score for a model (default 0.5)."""
-        return (self.model_preferences or {}).get(model, 0.5)
+        return self.model_preferences.get(model, 0.5)
 
     def get_tool_preference(self, tool: str) -> float:
         """Get preference score for a tool (default 0.5)."""
-        return (self.tool_preferences or {}).get(tool, 0.5)
+        return self.tool_preferences.get(tool, 0.5)
 
     def compute_score(
         self,
@@ -350,16 +518,350 @@ class UserPreferenceVectorEntry:
         Returns:
             Weighted score (higher is better)
         """
-        # Normalize cost and latency (invert so lower is better)
-        cost_normalized = 1.0 - min(cost / max_cost, 1.0)
-        latency_normalized = 1.0 - min(latency / max_latency, 1.0)
-
-        return (
-            accuracy * self.accuracy_weight +
-            cost_normalized * self.cost_weight +
-            latency_normalized * self.latency_weight
+        return _weighted_score(
+            accuracy, cost, latency,
+            self.accuracy_weight, self.cost_weight, self.latency_weight,
+            max_cost, max_latency
         )
 
+    def compute_scores(
+        self,
+        accuracies: Sequence[float],
+        costs: Sequence[float],
+        latencies: Sequence[float],
+        max_cost: float = 1.0,
+        max_latency: float = 10000.0
+    ) -> List[float]:
+        """
+        Compute weighted scores for many candidate decisions at once.
+
+        Equivalent to calling compute_score() per candidate, but weights and
+        normalization factors are resolved once for the whole batch.
+
+        Args:
+            accuracies: Accuracy score (0-1) per candidate
+            costs: Cost in USD per candidate
+            latencies: Latency in ms per candidate
+            max_cost: Max cost for normalization
+            max_latency: Max latency for normalization
+
+        Returns:
+            Weighted scores in candidate order (higher is better)
+        """
+        aw = self.accuracy_weight
+        cw = self.cost_weight
+        lw = self.latency_weight
+        inv_cost = 1.0 / max_cost
+        inv_latency = 1.0 / max_latency
+
+        scores = []
+        for acc, cost, lat in zip(accuracies, costs, latencies):
+            cost_ratio = cost * inv_cost
+            latency_ratio = lat * inv_latency
+            scores.append(
+                acc * aw
+                + (1.0 - cost_ratio if cost_ratio < 1.0 else 0.0) * cw
+                + (1.0 - latency_ratio if latency_ratio < 1.0 else 0.0) * lw
+            )
+        return scores
+
+
+# =============================================================================
+# RECALL CACHE
+# =============================================================================
+
+DEFAULT_RECALL_CACHE_SIZE = 256
+DEFAULT_RECALL_CACHE_TTL_SECONDS = 60.0
+
+# Orchestration lookups (preference vectors, best patterns) change at
+# feedback cadence, so they are cached a little longer/larger than recall
+DEFAULT_PREFERENCE_CACHE_SIZE = 512
+DEFAULT_PREFERENCE_CACHE_TTL_SECONDS = 60.0
+DEFAULT_PATTERN_CACHE_SIZE = 2048
+DEFAULT_PATTERN_CACHE_TTL_SECONDS = 30.0
+
+# Batched learn() entries held before an automatic flush
+DEFAULT_MAX_PENDING = 500
+
+# Longest a batched entry waits before a background flush writes it
+DEFAULT_FLUSH_INTERVAL_SECONDS = 2.0
+
+# Rows per multi-row INSERT request (keeps PostgREST payloads bounded)
+INSERT_CHUNK_SIZE = 500
+
+# Embeddings of recently seen texts (queries and entries); a text's vector
+# only changes with embed_fn, so entries live much longer than recall results
+DEFAULT_EMBEDDING_CACHE_SIZE = 1024
+DEFAULT_EMBEDDING_CACHE_TTL_SECONDS = 3600.0
+
+# Memory-file rows written by _append_many(): | timestamp | type | text | confidence |
+# The text cell is escaped by _cell_escape() ("|" and "\\" backslash-escaped,
+# line breaks collapsed), so it never contains a bare "|".
+_MEMORY_ROW_RE = re.compile(
+    r"^\|\s*(\S+)\s*\|\s*(episodic|semantic|procedural)\s*\|\s*((?:[^|\\]|\\.)*?)\s*\|\s*([0-9.]+)\s*\|\s*$"
+)
+_LINE_BREAK_RE = re.compile(r"\s*[\r\n]+\s*")
+_CELL_UNESCAPE_RE = re.compile(r"\\(.)")
+_TOKEN_RE = re.compile(r"\w+")
+
+# Query words OR-ed into the ilike fallback for lexical recall
+_ILIKE_MAX_TERMS = 8
+
+# Text field each memory type's file rows are recalled under
+_FILE_TEXT_FIELDS = {
+    "episodic": "summary",
+    "semantic": "statement",
+    "procedural": "name",
+}
+
+# Fields tried, in order, for the text column of a memory-file row
+_SUMMARY_KEYS = ("summary", "statement", "name")
+
+# One memory-file row: | timestamp | type | text | confidence |
+_MEMORY_ROW_FMT = "\n| {} | {} | {} | {} |".format
+
+
+def _summary_of(data: Dict[str, Any]) -> Any:
+    """First of summary/statement/name present in data ("unknown" if none)."""
+    return next((data[k] for k in _SUMMARY_KEYS if k in data), "unknown")
+
+
+def _cell_escape(text: Any) -> str:
+    """Make text safe for one markdown table cell of the memory file."""
+    text = _LINE_BREAK_RE.sub(" ", str(text))
+    return text.replace("\\", "\\\\").replace("|", "\\|")
+
+
+def _cell_unescape(text: str) -> str:
+    """Inverse of _cell_escape() (line breaks stay collapsed)."""
+    return _CELL_UNESCAPE_RE.sub(r"\1", text)
+
+# Opt-in semantic recall cache: paraphrased queries whose embeddings are at
+# least this cosine-similar to a cached query reuse its results
+DEFAULT_SEMANTIC_CACHE_SIZE = 512
+DEFAULT_SEMANTIC_CACHE_THRESHOLD = 0.92
+
+
+class RecallCache:
+    """
+    Small thread-safe TTL + LRU cache for recall results.
+
+    Keys are tuples whose first element is the memory type (or another
+    table tag) so entries can be invalidated per table after a write.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_RECALL_CACHE_SIZE,
+        ttl_seconds: float = DEFAULT_RECALL_CACHE_TTL_SECONDS
+    ):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Optional[Any]:
+        """Return a cached value, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Tuple, value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: Tuple) -> None:
+        """Drop a single entry if present."""
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def invalidate(self, tag: str) -> None:
+        """Drop every entry whose key starts with the given tag."""
+        with self._lock:
+            for key in [k for k in self._entries if k[0] == tag]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """Clear the entire cache."""
+        with self._lock:
+            self._entries.clear()
+
+
+class SemanticRecallCache:
+    """
+    Thread-safe TTL + LRU cache of recall results keyed by query meaning.
+
+    Query embeddings are stored L2-normalized, so cosine similarity is a
+    plain dot product. A lookup returns the results of the most similar
+    cached query with the same scope (memory types, limit, confidence,
+    window) when that similarity reaches the threshold. Entries are
+    bucketed by scope, so a lookup only scores candidates that could match.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_SEMANTIC_CACHE_SIZE,
+        threshold: float = DEFAULT_SEMANTIC_CACHE_THRESHOLD,
+        ttl_seconds: float = DEFAULT_RECALL_CACHE_TTL_SECONDS
+    ):
+        self.maxsize = maxsize
+        self.threshold = threshold
+        self.ttl_seconds = ttl_seconds
+        # key -> (expires_at, scope, value), in LRU order
+        self._entries: "OrderedDict[int, Tuple[float, Tuple, Any]]" = OrderedDict()
+        # scope -> {key: unit embedding}
+        self._by_scope: Dict[Tuple, Dict[int, List[float]]] = {}
+        self._next_key = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(embedding: Sequence[float]) -> Optional[List[float]]:
+        """Return the embedding scaled to unit length (None for a zero vector)."""
+        norm = math.sqrt(sum(map(operator.mul, embedding, embedding)))
+        if not norm:
+            return None
+        return [x / norm for x in embedding]
+
+    def get(self, scope: Tuple, unit_embedding: List[float]) -> Optional[Any]:
+        """Return the best cached value for scope above the threshold, or None."""
+        now = time.monotonic()
+        best_key, best_sim = None, self.threshold
+        with self._lock:
+            bucket = self._by_scope.get(scope)
+            if not bucket:
+                return None
+            for key, vector in list(bucket.items()):
+                if self._entries[key][0] < now:
+                    self._remove(key)
+                    continue
+                sim = sum(map(operator.mul, vector, unit_embedding))
+                if sim >= best_sim:
+                    best_key, best_sim = key, sim
+            if best_key is None:
+                return None
+            self._entries.move_to_end(best_key)
+            return self._entries[best_key][2]
+
+    def set(self, scope: Tuple, unit_embedding: List[float], value: Any) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        with self._lock:
+            key = self._next_key
+            self._next_key += 1
+            self._entries[key] = (time.monotonic() + self.ttl_seconds, scope, value)
+            self._by_scope.setdefault(scope, {})[key] = unit_embedding
+            while len(self._entries) > self.maxsize:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, tag: str) -> None:
+        """Drop every entry whose scope covers the given memory type."""
+        with self._lock:
+            for scope in [sc for sc in self._by_scope if tag in sc[0]]:
+                for key in self._by_scope.pop(scope):
+                    del self._entries[key]
+
+    def clear(self) -> None:
+        """Clear the entire cache."""
+        with self._lock:
+            self._entries.clear()
+            self._by_scope.clear()
+
+    def _remove(self, key: int) -> None:
+        """Remove one entry from both indexes (caller holds the lock)."""
+        _, scope, _ = self._entries.pop(key)
+        bucket = self._by_scope[scope]
+        del bucket[key]
+        if not bucket:
+            del self._by_scope[scope]
+
+
+# Columns recall consumers read per memory type; mirrors the RETURNS TABLE
+# lists of the recall_<type>() RPCs (see migration 20261016_008) and the
+# recall_columns() SQL used by match_memory/search_memory (20261016_014)
+RECALL_COLUMNS = {
+    "episodic": (
+        "id,event_type,summary,participants,related_projects,tags,outcome,"
+        "outcome_type,learnings,confidence,importance,event_timestamp,created_at"
+    ),
+    "semantic": (
+        "id,category,statement,explanation,evidence_count,confidence,domain,"
+        "subdomain,tags,valid_until,access_count,created_at"
+    ),
+    "procedural": (
+        "id,procedure_type,name,description,steps,preference_value,"
+        "preference_strength,trigger_keywords,applies_to,usage_count,"
+        "success_rate,confidence,created_at"
+    ),
+}
+
+# Columns returned by get_entity_relationships()
+RELATIONSHIP_COLUMNS = (
+    "id,source_type,source_name,relationship,relationship_category,"
+    "target_type,target_name,properties,bidirectional,confidence,created_at"
+)
+
+# Columns returned by recall_preferences(): what callers format and rank on,
+# without steps/source/embedding payloads
+PREFERENCE_COLUMNS = (
+    "id,procedure_type,name,description,preference_value,preference_strength,"
+    "applies_to,usage_count,success_rate,confidence,created_at"
+)
+
+# Audit columns aggregated by the client-side efficiency report fallback
+EFFICIENCY_COLUMNS = (
+    "id,model_used,estimated_cost_usd,latency_ms,outcome,tokens_input,tokens_output"
+)
+
+# (keyword, recommendation) rules applied to event-frequency patterns by reflect()
+RECOMMENDATION_RULES = (
+    ("error", "Consider reviewing error patterns for common root causes"),
+    ("success", "Document successful patterns as procedural memory"),
+)
+
+# Memory types with a recall_<type>() recency RPC (see migration 20261016_005)
+_RECALL_RPC_TYPES = frozenset({
+    MemoryType.EPISODIC,
+    MemoryType.SEMANTIC,
+    MemoryType.PROCEDURAL,
+})
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_supabase_client(url: str, key: str):
+    """
+    One Supabase client per (url, key), shared by every repository.
+
+    The client's PostgREST session is a pooled keep-alive HTTP client, so
+    sharing it lets every KnowledgeRepository (middleware, orchestrator,
+    router, chat commands) reuse warm TLS connections instead of each
+    opening its own pool.
+    """
+    from supabase import create_client
+    return create_client(url, key)
+
+
+class PartialInsertError(RuntimeError):
+    """
+    A chunked multi-row insert failed after earlier chunks were committed.
+
+    ``committed`` is the number of leading rows already stored; only the
+    rows after them need to be retried.
+    """
+
+    def __init__(self, committed: int, cause: Exception):
+        super().__init__(f"insert failed after {committed} rows were committed: {cause}")
+        self.committed = committed
+
 
 # =============================================================================
 # KNOWLEDGE REPOSITORY
@@ -377,7 +879,12 @@ class KnowledgeRepository:
         self,
         supabase_url: Optional[str] = None,
         supabase_key: Optional[str] = None,
-        memory_file: str = "CLAUDE.memory.md"
+        memory_file: str = "CLAUDE.memory.md",
+        embed_fn: Optional[Callable[[str], List[float]]] = None,
+        embed_batch_fn: Optional[Callable[[List[str]], List[List[float]]]] = None,
+        max_pending: int = DEFAULT_MAX_PENDING,
+        semantic_cache: bool = False,
+        flush_interval: Optional[float] = DEFAULT_FLUSH_INTERVAL_SECONDS
     ):
         """
         Initialize the knowledge repository.
@@ -386,22 +893,72 @@ class KnowledgeRepository:
             supabase_url: Supabase project URL (optional, for persistent storage)
             supabase_key: Supabase anon key (optional)
             memory_file: Path to CLAUDE.memory.md file
+            embed_fn: Optional text -> embedding function (1536 dims, matching
+                the schema). When set, entries are stored with embeddings and
+                recall() ranks by vector similarity via match_memory().
+            embed_batch_fn: Optional texts -> embeddings function used by
+                learn_many() to embed a whole batch in one model call
+            max_pending: Batched entries held before learn() flushes the
+                queue automatically
+            semantic_cache: Reuse recall() results for paraphrased queries
+                (requires embed_fn); off by default
+            flush_interval: Seconds after the first batched entry before a
+                background flush (None to flush only on size or by hand)
         """
         self.supabase_url = supabase_url or os.getenv("SUPABASE_URL")
         self.supabase_key = supabase_key or os.getenv("SUPABASE_ANON_KEY")
         self.memory_file = memory_file
+        self.embed_fn = embed_fn
+        self.embed_batch_fn = embed_batch_fn
         self.supabase = None
 
         # Initialize Supabase client if credentials provided
         if self.supabase_url and self.supabase_key:
             try:
-                from supabase import create_client
-                self.supabase = create_client(self.supabase_url, self.supabase_key)
+                self.supabase = _shared_supabase_client(self.supabase_url, self.supabase_key)
             except ImportError:
                 print("Warning: supabase-py not installed. Using file-only storage.")
 
-        # Local queue for batch operations
-        self._pending_queue: List[Dict[str, Any]] = []
+        # Local queue for batch operations: row dicts bucketed by memory type,
+        # so each bucket is already a multi-row insert payload. flush_pending()
+        # swaps in an empty queue under _pending_lock and writes the old one
+        # outside it, so learn() never waits on a flush's network I/O.
+        self._pending: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+        self._max_pending = max_pending
+        self._flush_interval = flush_interval
+        self._flush_timer: Optional[threading.Timer] = None
+        self._pending_lock = threading.RLock()
+        self._flush_lock = threading.Lock()
+
+        # Memory file handle for file-only mode, opened on first append
+        self._memory_handle = None
+        self._memory_lock = threading.Lock()
+
+        # Inverted index over memory-file rows (token -> row positions),
+        # rebuilt when the file's size or mtime changes
+        self._file_entries: List[Dict[str, Any]] = []
+        self._file_index: Dict[str, Set[int]] = {}
+        self._file_stamp: Optional[Tuple[float, int]] = None
+        self._file_index_lock = threading.Lock()
+
+        # Thread pool for concurrent per-type recall queries
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+        # Short-lived cache of recall results (invalidated on writes)
+        self._recall_cache = RecallCache()
+        self._semantic_cache = SemanticRecallCache() if semantic_cache else None
+        self._embedding_cache = RecallCache(
+            DEFAULT_EMBEDDING_CACHE_SIZE, DEFAULT_EMBEDDING_CACHE_TTL_SECONDS
+        )
+
+        # Orchestration lookups: preference vectors keyed by (user, context),
+        # best patterns keyed by task context first for invalidation
+        self._preference_cache = RecallCache(
+            DEFAULT_PREFERENCE_CACHE_SIZE, DEFAULT_PREFERENCE_CACHE_TTL_SECONDS
+        )
+        self._pattern_cache = RecallCache(
+            DEFAULT_PATTERN_CACHE_SIZE, DEFAULT_PATTERN_CACHE_TTL_SECONDS
+        )
 
     # =========================================================================
     # LEARN OPERATIONS
@@ -420,28 +977,86 @@ class KnowledgeRepository:
             memory_type: Type of memory (episodic, semantic, procedural)
             entry: The entry to store (EpisodicEntry, SemanticEntry, etc.)
             batch: If True, queue for batch insert instead of immediate
+                (written on flush_pending(), at max_pending, or after
+                flush_interval seconds; a failed flush is retried in the
+                background, never raised)
 
         Returns:
             Entry ID if immediate insert, None if batched
         """
         data = entry.to_dict()
 
+        # Always set (None when unavailable): batched rows become one
+        # multi-row insert, and PostgREST requires identical keys per row
+        data["embedding"] = self._embed(self._embedding_text(data))
+
         if batch:
-            self._pending_queue.append({
-                "type": memory_type.value,
-                "data": data
-            })
+            with self._pending_lock:
+                self._pending[memory_type.value].append(data)
+                # Bound the queue so a forgotten flush can't grow it without limit
+                full = self.pending_count >= self._max_pending
+                if not full:
+                    self._schedule_flush()
+            if full:
+                try:
+                    self.flush_pending()
+                except Exception as e:
+                    # The entry is queued either way; raising would invite a
+                    # retry that queues it twice. flush_pending() cancelled the
+                    # timer, so re-arm it to retry the requeued rows.
+                    logger.warning(f"Flush at max_pending failed, will retry: {e}")
+                    with self._pending_lock:
+                        self._schedule_flush()
             return None
 
         if self.supabase:
             table = f"arcus_{memory_type.value}_memory"
             result = self.supabase.table(table).insert(data).execute()
+            self._invalidate_recall_cache(memory_type.value)
             return result.data[0]["id"] if result.data else None
         else:
             # Fallback to file-based storage
             self._append_to_memory_file(memory_type.value, data)
             return "file-based"
 
+    def learn_many(
+        self,
+        memory_type: MemoryType,
+        entries: Sequence[Any]
+    ) -> List[Optional[str]]:
+        """
+        Store several entries of one memory type with a single insert.
+
+        Args:
+            memory_type: Type of memory (episodic, semantic, procedural)
+            entries: Entries to store (EpisodicEntry, SemanticEntry, etc.)
+
+        Returns:
+            Entry IDs in input order ("file-based" in file-only mode)
+
+        Raises:
+            PartialInsertError: if a chunk after the first failed; its
+                ``committed`` count of leading entries were stored
+        """
+        if not entries:
+            return []
+
+        rows = [entry.to_dict() for entry in entries]
+        embeddings = self._embed_many([self._embedding_text(data) for data in rows])
+        # None when unavailable, so every row has the same keys
+        for data, embedding in zip(rows, embeddings):
+            data["embedding"] = embedding
+
+        if self.supabase:
+            try:
+                inserted = self._insert_rows(f"arcus_{memory_type.value}_memory", rows)
+            finally:
+                self._invalidate_recall_cache(memory_type.value)
+            return [row["id"] for row in inserted]
+
+        self._append_many([(memory_type.value, data) for data in rows])
+        return ["file-based"] * len(rows)
+
     def learn_preference(
         self,
         preference: str,
@@ -461,14 +1076,7 @@ class KnowledgeRepository:
         Returns:
             Entry ID
         """
-        entry = ProceduralEntry(
-            procedure_type=ProcedureType.PREFERENCE,
-            name=preference[:50],  # Truncate for name field
-            description=preference,
-            preference_value={"value": value} if value else None,
-            confidence=confidence,
-            source=KnowledgeSource(type=source_type)
-        )
+        entry = self.preference_entry(preference, value, confidence, source_type)
         return self.learn(MemoryType.PROCEDURAL, entry)
 
     def learn_fact(
@@ -476,7 +1084,8 @@ class KnowledgeRepository:
         statement: str,
         domain: Optional[str] = None,
         evidence: Optional[List[str]] = None,
-        confidence: float = 0.8
+        confidence: float = 0.8,
+        category: SemanticCategory = SemanticCategory.FACT
     ) -> Optional[str]:
         """
         Convenience method to learn a fact.
@@ -486,18 +1095,12 @@ class KnowledgeRepository:
             domain: Knowledge domain (e.g., "clients", "technology")
             evidence: Supporting evidence
             confidence: Confidence score (0-1)
+            category: Semantic category (default: fact)
 
         Returns:
             Entry ID
         """
-        entry = SemanticEntry(
-            category=SemanticCategory.FACT,
-            statement=statement,
-            domain=domain,
-            evidence=evidence,
-            confidence=confidence,
-            source=KnowledgeSource(type=SourceType.USER_EXPLICIT)
-        )
+        entry = self.fact_entry(statement, domain, evidence, confidence, category)
         return self.learn(MemoryType.SEMANTIC, entry)
 
     def learn_event(
@@ -506,7 +1109,8 @@ class KnowledgeRepository:
         summary: str,
         participants: Optional[List[str]] = None,
         outcome: Optional[str] = None,
-        learnings: Optional[List[str]] = None
+        learnings: Optional[List[str]] = None,
+        confidence: float = 0.8
     ) -> Optional[str]:
         """
         Convenience method to record an event.
@@ -517,19 +1121,71 @@ class KnowledgeRepository:
             participants: Who was involved
             outcome: What was the result
             learnings: What we learned
+            confidence: Confidence score (0-1)
 
         Returns:
             Entry ID
         """
-        entry = EpisodicEntry(
+        entry = self.event_entry(event_type, summary, participants, outcome, learnings, confidence)
+        return self.learn(MemoryType.EPISODIC, entry)
+
+    # Entry builders behind learn_preference/learn_fact/learn_event, for
+    # callers that batch the same entries through learn_many()
+
+    @staticmethod
+    def preference_entry(
+        preference: str,
+        value: Optional[Any] = None,
+        confidence: float = 0.9,
+        source_type: SourceType = SourceType.USER_EXPLICIT
+    ) -> ProceduralEntry:
+        """Build the entry learn_preference() stores."""
+        return ProceduralEntry(
+            procedure_type=ProcedureType.PREFERENCE,
+            name=preference[:50],  # Truncate for name field
+            description=preference,
+            preference_value={"value": value} if value else None,
+            confidence=confidence,
+            source=KnowledgeSource.get(type=source_type)
+        )
+
+    @staticmethod
+    def fact_entry(
+        statement: str,
+        domain: Optional[str] = None,
+        evidence: Optional[List[str]] = None,
+        confidence: float = 0.8,
+        category: SemanticCategory = SemanticCategory.FACT
+    ) -> SemanticEntry:
+        """Build the entry learn_fact() stores."""
+        return SemanticEntry(
+            category=category,
+            statement=statement,
+            domain=domain,
+            evidence=evidence,
+            confidence=confidence,
+            source=KnowledgeSource.get(type=SourceType.USER_EXPLICIT)
+        )
+
+    @staticmethod
+    def event_entry(
+        event_type: EventType,
+        summary: str,
+        participants: Optional[List[str]] = None,
+        outcome: Optional[str] = None,
+        learnings: Optional[List[str]] = None,
+        confidence: float = 0.8
+    ) -> EpisodicEntry:
+        """Build the entry learn_event() stores."""
+        return EpisodicEntry(
             event_type=event_type,
             summary=summary,
             participants=participants or [],
             outcome=outcome,
             learnings=learnings,
-            source=KnowledgeSource(type=SourceType.USER_EXPLICIT)
+            confidence=confidence,
+            source=KnowledgeSource.get(type=SourceType.USER_EXPLICIT)
         )
-        return self.learn(MemoryType.EPISODIC, entry)
 
     # =========================================================================
     # RECALL OPERATIONS
@@ -547,10 +1203,13 @@ class KnowledgeRepository:
         Retrieve relevant knowledge from the repository.
 
         Args:
-            query: Search query
+            query: Search query; "" is the canonical "most recent" call and
+                skips embedding and text search entirely
             memory_types: Which memory types to search (default: all)
             limit: Maximum results per type
-            min_confidence: Minimum confidence threshold
+            min_confidence: Minimum confidence threshold. Values >= 0.5 are
+                served by a partial index; lower values fall back to the
+                general (created_at, confidence) index.
             days_back: Only search within this many days
 
         Returns:
@@ -559,39 +1218,234 @@ class KnowledgeRepository:
         if memory_types is None:
             memory_types = [MemoryType.EPISODIC, MemoryType.SEMANTIC, MemoryType.PROCEDURAL]
 
-        results = {}
+        # Embed once for every memory type (and the semantic cache)
+        query_embedding = self._embed(query) if self.supabase and query.strip() else None
+
+        semantic_scope, unit_embedding = self._semantic_key(
+            query_embedding, memory_types, limit, min_confidence, days_back
+        )
+        if unit_embedding is not None:
+            cached = self._semantic_cache.get(semantic_scope, unit_embedding)
+            if cached is not None:
+                return cached
+
+        def fetch(memory_type: MemoryType) -> List[Dict[str, Any]]:
+            return self._recall_by_type(
+                query, memory_type, limit, min_confidence, days_back, query_embedding
+            )
+
+        # Per-type queries are independent: run them concurrently so latency
+        # is the slowest query rather than the sum of all of them
+        if self.supabase and len(memory_types) > 1:
+            type_results = list(self._get_executor().map(fetch, memory_types))
+        else:
+            type_results = [fetch(memory_type) for memory_type in memory_types]
+
+        results = {
+            memory_type.value: rows
+            for memory_type, rows in zip(memory_types, type_results)
+        }
+        if unit_embedding is not None:
+            self._semantic_cache.set(semantic_scope, unit_embedding, results)
+        return results
+
+    async def recall_async(
+        self,
+        query: str,
+        memory_types: Optional[List[MemoryType]] = None,
+        limit: int = 10,
+        min_confidence: float = 0.5,
+        days_back: Optional[int] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Async variant of recall() for event-loop callers.
+
+        Each memory type is queried in a worker thread and awaited with
+        asyncio.gather, so the loop is never blocked on Supabase.
+        """
+        if memory_types is None:
+            memory_types = [MemoryType.EPISODIC, MemoryType.SEMANTIC, MemoryType.PROCEDURAL]
+
+        query_embedding = (
+            await asyncio.to_thread(self._embed, query) if self.supabase and query.strip() else None
+        )
 
-        for memory_type in memory_types:
-            type_results = self._recall_by_type(
-                query, memory_type, limit, min_confidence, days_back
+        semantic_scope, unit_embedding = self._semantic_key(
+            query_embedding, memory_types, limit, min_confidence, days_back
+        )
+        if unit_embedding is not None:
+            cached = self._semantic_cache.get(semantic_scope, unit_embedding)
+            if cached is not None:
+                return cached
+
+        type_results = await asyncio.gather(*(
+            asyncio.to_thread(
+                self._recall_by_type, query, memory_type, limit, min_confidence,
+                days_back, query_embedding
             )
-            results[memory_type.value] = type_results
+            for memory_type in memory_types
+        ))
 
+        results = {
+            memory_type.value: rows
+            for memory_type, rows in zip(memory_types, type_results)
+        }
+        if unit_embedding is not None:
+            self._semantic_cache.set(semantic_scope, unit_embedding, results)
         return results
 
+    def _semantic_key(
+        self,
+        query_embedding: Optional[List[float]],
+        memory_types: List[MemoryType],
+        limit: int,
+        min_confidence: float,
+        days_back: Optional[int]
+    ) -> Tuple[Optional[Tuple], Optional[List[float]]]:
+        """(scope, unit embedding) for the semantic cache, or (None, None) when it doesn't apply."""
+        if self._semantic_cache is None or query_embedding is None:
+            return None, None
+        scope = (
+            frozenset(memory_type.value for memory_type in memory_types),
+            limit, min_confidence, days_back
+        )
+        return scope, SemanticRecallCache.normalize(query_embedding)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Shared thread pool for concurrent Supabase queries (created lazily)."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=len(MemoryType),
+                thread_name_prefix="arcus-recall"
+            )
+        return self._executor
+
     def _recall_by_type(
         self,
         query: str,
         memory_type: MemoryType,
         limit: int,
         min_confidence: float,
-        days_back: Optional[int]
+        days_back: Optional[int],
+        query_embedding: Optional[List[float]] = None
     ) -> List[Dict[str, Any]]:
         """Recall from a specific memory type."""
         if not self.supabase:
-            return self._recall_from_file(query, memory_type.value)
+            return self._recall_from_file(query, memory_type.value, limit, min_confidence)
+
+        # Empty query: most-recent entries, no embedding or text search
+        query = query.strip()
+        if not query:
+            return self._recall_recent(memory_type, limit, min_confidence, days_back)
+
+        cache_key = (memory_type.value, limit, min_confidence, days_back, query)
+        cached = self._recall_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
         table = f"arcus_{memory_type.value}_memory"
+        cutoff = _utc_cutoff(days_back) if days_back else None
+
+        # Vector recall: nearest neighbours via the HNSW index
+        if query_embedding is None:
+            query_embedding = self._embed(query)
+        if query_embedding is not None:
+            params: Dict[str, Any] = {
+                "query_embedding": query_embedding,
+                "table_name": table,
+                "match_count": limit,
+                "min_confidence": min_confidence,
+            }
+            if cutoff:
+                params["created_after"] = cutoff
+            try:
+                result = self.supabase.rpc("match_memory", params).execute()
+                rows = result.data if result.data else []
+            except Exception as e:
+                # RPC not deployed yet: recency query, as before vector recall
+                logger.warning("match_memory unavailable (%s), querying directly", e)
+                rows = self._select_recent(memory_type, limit, min_confidence, days_back)
+            self._recall_cache.set(cache_key, rows)
+            return rows
+
+        # Lexical recall: ranked full-text match via the GIN index
+        params = {
+            "q": query,
+            "table_name": table,
+            "match_count": limit,
+            "min_confidence": min_confidence,
+        }
+        if cutoff:
+            params["created_after"] = cutoff
+        try:
+            result = self.supabase.rpc("search_memory", params).execute()
+            rows = result.data if result.data else []
+        except Exception as e:
+            # RPC not deployed yet: keyword ilike over the text column
+            logger.warning("search_memory unavailable (%s), querying directly", e)
+            rows = self._select_recent(memory_type, limit, min_confidence, days_back, query)
+        self._recall_cache.set(cache_key, rows)
+        return rows
+
+    def _recall_recent(
+        self,
+        memory_type: MemoryType,
+        limit: int,
+        min_confidence: float,
+        days_back: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        """Most recent entries of a memory type (served by the created_at indexes)."""
+        cache_key = (memory_type.value, limit, min_confidence, days_back, "")
+        cached = self._recall_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        # Recency recall: server-side function with a cached plan
+        if memory_type in _RECALL_RPC_TYPES:
+            try:
+                result = self.supabase.rpc(f"recall_{memory_type.value}", {
+                    "k": limit,
+                    "min_conf": min_confidence,
+                    "days": days_back,
+                }).execute()
+                rows = result.data if result.data else []
+                self._recall_cache.set(cache_key, rows)
+                return rows
+            except Exception as e:
+                # RPC not deployed yet: same query through the builder
+                logger.warning("recall_%s unavailable (%s), querying directly", memory_type.value, e)
+
+        rows = self._select_recent(memory_type, limit, min_confidence, days_back)
+        self._recall_cache.set(cache_key, rows)
+        return rows
+
+    def _select_recent(
+        self,
+        memory_type: MemoryType,
+        limit: int,
+        min_confidence: float,
+        days_back: Optional[int],
+        query: str = ""
+    ) -> List[Dict[str, Any]]:
+        """
+        Most recent entries through a plain table query (no RPCs required).
 
+        With a query, only rows whose text column contains any of its words
+        (case-insensitive) are returned.
+        """
         # Build query
-        q = self.supabase.table(table).select("*")
+        q = self.supabase.table(f"arcus_{memory_type.value}_memory") \
+            .select(RECALL_COLUMNS.get(memory_type.value, "*"))
         q = q.gte("confidence", min_confidence)
+        terms = list(dict.fromkeys(_TOKEN_RE.findall(query.lower())))[:_ILIKE_MAX_TERMS]
+        if terms:
+            column = _FILE_TEXT_FIELDS[memory_type.value]
+            q = q.or_(",".join(f"{column}.ilike.*{term}*" for term in terms))
         q = q.order("created_at", desc=True)
         q = q.limit(limit)
 
         if days_back:
-            cutoff = (datetime.utcnow() - timedelta(days=days_back)).isoformat()
-            q = q.gte("created_at", cutoff)
+            q = q.gte("created_at", _utc_cutoff(days_back))
 
         result = q.execute()
         return result.data if result.data else []
@@ -604,14 +1458,85 @@ class KnowledgeRepository:
             List of preference entries
         """
         if self.supabase:
+            cache_key = (MemoryType.PROCEDURAL.value, "preferences")
+            cached = self._recall_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
             result = self.supabase.table("arcus_procedural_memory") \
-                .select("*") \
+                .select(PREFERENCE_COLUMNS) \
                 .eq("procedure_type", "preference") \
                 .order("created_at", desc=True) \
                 .execute()
-            return result.data if result.data else []
+            rows = result.data if result.data else []
+            self._recall_cache.set(cache_key, rows)
+            return rows
         return []
 
+    def _embed(self, text: str) -> Optional[List[float]]:
+        """Embed text with the configured embed_fn (None if unavailable)."""
+        if not self.embed_fn or not text:
+            return None
+        cache_key = (text,)
+        embedding = self._embedding_cache.get(cache_key)
+        if embedding is not None:
+            return embedding
+        try:
+            embedding = self.embed_fn(text)
+        except Exception as e:
+            logger.warning(f"Embedding failed, continuing without vector: {e}")
+            return None
+        if embedding is not None:
+            self._embedding_cache.set(cache_key, embedding)
+        return embedding
+
+    def _embed_many(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Embed several texts, batching cache misses into one embed_batch_fn call.
+
+        Falls back to per-text _embed() when no batch function is configured
+        or the batch call fails.
+        """
+        if not self.embed_batch_fn:
+            return [self._embed(text) for text in texts]
+
+        embeddings: List[Optional[List[float]]] = [
+            self._embedding_cache.get((text,)) if text else None for text in texts
+        ]
+        missing = [
+            i for i, (text, embedding) in enumerate(zip(texts, embeddings))
+            if text and embedding is None
+        ]
+        if not missing:
+            return embeddings
+
+        try:
+            computed = self.embed_batch_fn([texts[i] for i in missing])
+        except Exception as e:
+            logger.warning(f"Batch embedding failed, embedding one at a time: {e}")
+            return [self._embed(text) for text in texts]
+
+        for i, embedding in zip(missing, computed):
+            embeddings[i] = embedding
+            if embedding is not None:
+                self._embedding_cache.set((texts[i],), embedding)
+        return embeddings
+
+    @staticmethod
+    def _embedding_text(data: Dict[str, Any]) -> str:
+        """Pick the text to embed for an entry dict (summary/statement/name)."""
+        if data.get("summary"):
+            return data["summary"]
+        if data.get("statement"):
+            return data["statement"]
+        return " ".join(filter(None, (data.get("name"), data.get("description"))))
+
+    def _invalidate_recall_cache(self, memory_type: str) -> None:
+        """Drop cached recall results for a memory type after a write."""
+        self._recall_cache.invalidate(memory_type)
+        if self._semantic_cache is not None:
+            self._semantic_cache.invalidate(memory_type)
+
     def recall_recent_events(self, days: int = 7) -> List[Dict[str, Any]]:
         """
         Recall recent episodic events.
@@ -653,9 +1578,8 @@ class KnowledgeRepository:
         Returns:
             Relationship ID
         """
-        # First, ensure entities exist
-        self._ensure_entity(source_type, source_name)
-        self._ensure_entity(target_type, target_name)
+        # First, ensure entities exist (both endpoints in one upsert)
+        self._ensure_entities([(source_type, source_name), (target_type, target_name)])
 
         # Create relationship
         entry = RelationshipEntry(
@@ -666,7 +1590,7 @@ class KnowledgeRepository:
             target_name=target_name,
             properties=properties,
             confidence=confidence,
-            source=KnowledgeSource(type=SourceType.USER_EXPLICIT)
+            source=KnowledgeSource.get(type=SourceType.USER_EXPLICIT)
         )
 
         if self.supabase:
@@ -677,23 +1601,34 @@ class KnowledgeRepository:
 
     def _ensure_entity(self, entity_type: str, name: str) -> None:
         """Ensure an entity exists in the registry."""
+        self._ensure_entities([(entity_type, name)])
+
+    def _ensure_entities(self, entities: List[Tuple[str, str]]) -> None:
+        """
+        Ensure entities exist in the registry with a single UPSERT.
+
+        Relies on the UNIQUE(entity_type, name) constraint; existing rows are
+        left untouched (ignore_duplicates), so there is no SELECT round trip
+        and no check-then-insert race. Nothing is read back (return=minimal),
+        so the response carries no row payload.
+        """
         if not self.supabase:
             return
 
-        # Check if exists
-        result = self.supabase.table("arcus_entities") \
-            .select("id") \
-            .eq("entity_type", entity_type) \
-            .eq("name", name) \
-            .execute()
-
-        if not result.data:
-            # Create entity
-            self.supabase.table("arcus_entities").insert({
+        rows = [
+            {
                 "entity_type": entity_type,
                 "name": name,
                 "source": {"type": "system", "note": "auto-created from relationship"}
-            }).execute()
+            }
+            for entity_type, name in dict.fromkeys(entities)
+        ]
+        self.supabase.table("arcus_entities").upsert(
+            rows,
+            on_conflict="entity_type,name",
+            ignore_duplicates=True,
+            returning="minimal"
+        ).execute()
 
     def get_entity_relationships(
         self,
@@ -713,24 +1648,37 @@ class KnowledgeRepository:
         if not self.supabase:
             return []
 
-        # Get relationships where entity is source
-        q1 = self.supabase.table("arcus_relationships") \
-            .select("*") \
-            .eq("source_name", entity_name)
+        # Match the entity on either end of the edge in a single request
+        name = self._quote_filter_value(entity_name)
         if entity_type:
-            q1 = q1.eq("source_type", entity_type)
+            etype = self._quote_filter_value(entity_type)
+            condition = (
+                f"and(source_name.eq.{name},source_type.eq.{etype}),"
+                f"and(target_name.eq.{name},target_type.eq.{etype})"
+            )
+        else:
+            condition = f"source_name.eq.{name},target_name.eq.{name}"
 
-        # Get relationships where entity is target
-        q2 = self.supabase.table("arcus_relationships") \
-            .select("*") \
-            .eq("target_name", entity_name)
-        if entity_type:
-            q2 = q2.eq("target_type", entity_type)
+        result = self.supabase.table("arcus_relationships") \
+            .select(RELATIONSHIP_COLUMNS) \
+            .or_(condition) \
+            .execute()
+
+        return result.data or []
 
-        r1 = q1.execute()
-        r2 = q2.execute()
+    async def get_entity_relationships_async(
+        self,
+        entity_name: str,
+        entity_type: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Async variant of get_entity_relationships() (runs in a worker thread)."""
+        return await asyncio.to_thread(self.get_entity_relationships, entity_name, entity_type)
 
-        return (r1.data or []) + (r2.data or [])
+    @staticmethod
+    def _quote_filter_value(value: str) -> str:
+        """Double-quote a value for a PostgREST or=() filter (commas, parens, dots)."""
+        escaped = value.replace("\\", "\\\\").replace('"', '\\"')
+        return f'"{escaped}"'
 
     # =========================================================================
     # REFLECT OPERATIONS
@@ -753,62 +1701,126 @@ class KnowledgeRepository:
         Returns:
             Dictionary with insights and recommendations
         """
-        # Get recent data
-        recent_events = self.recall_recent_events(days)
-        preferences = self.recall_preferences()
+        now = datetime.utcnow()
+
+        # Count event types (aggregated server-side when connected)
+        if self.supabase:
+            event_counts = self._fetch_event_counts(days)
+            total_preferences = self._count_preferences()
+        else:
+            recent_events = self.recall_recent_events(days)
+            event_counts = Counter(e.get("event_type", "unknown") for e in recent_events)
+            total_preferences = len(self.recall_preferences())
 
         # Analyze patterns (simplified)
         patterns = []
 
-        # Count event types
-        event_counts: Dict[str, int] = {}
-        for event in recent_events:
-            event_type = event.get("event_type", "unknown")
-            event_counts[event_type] = event_counts.get(event_type, 0) + 1
-
         for event_type, count in event_counts.items():
             if count >= min_evidence:
+                confidence = min(0.9, 0.5 + (count * 0.1))
                 patterns.append({
                     "type": "event_frequency",
                     "pattern": f"{count} {event_type} events in last {days} days",
                     "evidence_count": count,
-                    "confidence": min(0.9, 0.5 + (count * 0.1))
+                    "confidence": confidence
                 })
 
         return {
             "period": {
                 "days": days,
-                "start": (datetime.utcnow() - timedelta(days=days)).isoformat(),
-                "end": datetime.utcnow().isoformat()
+                "start": (now - timedelta(days=days)).isoformat(),
+                "end": now.isoformat()
             },
             "summary": {
-                "total_events": len(recent_events),
-                "total_preferences": len(preferences),
+                "total_events": sum(event_counts.values()),
+                "total_preferences": total_preferences,
                 "patterns_found": len(patterns)
             },
             "patterns": patterns,
-            "recommendations": self._generate_recommendations(patterns, preferences)
+            "recommendations": self._generate_recommendations(patterns)
         }
 
-    def _generate_recommendations(
+    def _fetch_event_counts(self, days: int) -> Dict[str, int]:
+        """Event counts by type over the last N days via the reflect_event_counts RPC."""
+        try:
+            result = self.supabase.rpc("reflect_event_counts", {"p_days": days}).execute()
+            return {row["event_type"]: row["event_count"] for row in (result.data or [])}
+        except Exception as e:
+            # RPC not deployed yet: stream the window page by page instead
+            logger.warning("reflect_event_counts unavailable (%s), counting client-side", e)
+
+        cutoff = _utc_cutoff(days)
+        rows = self._iter_table(
+            "arcus_episodic_memory",
+            [("gte", "created_at", cutoff), ("gte", "confidence", 0.5)],
+            columns="event_type",
+        )
+        return Counter(row.get("event_type", "unknown") for row in rows)
+
+    def _count_preferences(self) -> int:
+        """Number of stored preferences via the reflect_preference_count RPC."""
+        try:
+            result = self.supabase.rpc("reflect_preference_count", {}).execute()
+            return int(result.data or 0)
+        except Exception as e:
+            # RPC not deployed yet: exact count without fetching rows
+            logger.warning("reflect_preference_count unavailable (%s), counting via select", e)
+
+        result = self.supabase.table("arcus_procedural_memory") \
+            .select("id", count="exact", head=True) \
+            .eq("procedure_type", "preference") \
+            .execute()
+        return result.count if result.count else 0
+
+    def _iter_table(
         self,
-        patterns: List[Dict[str, Any]],
-        preferences: List[Dict[str, Any]]
-    ) -> List[str]:
-        """Generate recommendations from patterns and preferences."""
+        table: str,
+        filters: List[Tuple[str, str, Any]],
+        columns: str = "*",
+        page: int = 500,
+        order_by: str = "created_at"
+    ):
+        """
+        Yield every matching row of a table, one page at a time.
+
+        Args:
+            table: Table name
+            filters: (operator, column, value) tuples, e.g. ("gte", "created_at", cutoff);
+                dotted operators such as "not_.is_" are applied in sequence
+            columns: Columns to select
+            page: Rows fetched per request
+            order_by: Timestamp column to page through, newest first
+
+        Yields:
+            Row dictionaries, newest first
+        """
+        offset = 0
+        while True:
+            query = self.supabase.table(table).select(columns)
+            for op, column, value in filters:
+                for name in op.split("."):
+                    query = getattr(query, name)
+                query = query(column, value)
+            result = query.order(order_by, desc=True).order("id").range(
+                offset, offset + page - 1
+            ).execute()
+            rows = result.data or []
+            yield from rows
+            if len(rows) < page:
+                return
+            offset += page
+
+    def _generate_recommendations(self, patterns: List[Dict[str, Any]]) -> List[str]:
+        """Generate recommendations from detected patterns."""
         recommendations = []
 
         # Add basic recommendations based on patterns
         for pattern in patterns:
             if pattern.get("type") == "event_frequency":
-                if "error" in pattern.get("pattern", "").lower():
-                    recommendations.append(
-                        "Consider reviewing error patterns for common root causes"
-                    )
-                if "success" in pattern.get("pattern", "").lower():
-                    recommendations.append(
-                        "Document successful patterns as procedural memory"
-                    )
+                text = pattern.get("pattern", "").lower()
+                for keyword, recommendation in RECOMMENDATION_RULES:
+                    if keyword in text:
+                        recommendations.append(recommendation)
 
         return recommendations
 
@@ -861,42 +1873,32 @@ class KnowledgeRepository:
             total_latency_ms=total_latency_ms,
             tokens_used=tokens_used,
             user_preference_context=preference_context,
-            source=KnowledgeSource(type=SourceType.SYSTEM)
+            source=KnowledgeSource.get(type=SourceType.SYSTEM)
         )
 
         if self.supabase:
-            # Use atomic UPSERT to avoid race conditions
+            # Insert-or-increment in one atomic statement (one round trip)
             # Relies on UNIQUE(task_context, model_used) constraint
             data = entry.to_dict()
-            data["success_count"] = 1 if outcome == PatternOutcome.SUCCESS else 0
-            data["failure_count"] = 1 if outcome == PatternOutcome.FAILURE else 0
-            data["usage_count"] = 1
-
-            result = self.supabase.table("arcus_model_patterns").upsert(
-                data,
-                on_conflict="task_context,model_used",
-                # On conflict, increment counters instead of replacing
-                # Note: Supabase upsert will merge with existing row
+            result = self.supabase.rpc(
+                "record_model_pattern",
+                {
+                    "p_task_context": data["task_context"],
+                    "p_model_used": data["model_used"],
+                    "p_outcome": data["outcome"],
+                    "p_task_complexity": data["task_complexity"],
+                    "p_tools_sequence": data["tools_sequence"],
+                    "p_accuracy_score": data["accuracy_score"],
+                    "p_cost": data["total_cost_usd"],
+                    "p_latency": data["total_latency_ms"],
+                    "p_tokens": data["tokens_used"],
+                    "p_preference_context": data["user_preference_context"],
+                    "p_confidence": data["confidence"],
+                    "p_source": data["source"]
+                }
             ).execute()
-
-            if result.data:
-                pattern_id = result.data[0]["id"]
-                # Update counters atomically using RPC or raw SQL
-                # For now, do a follow-up update to increment counters
-                self.supabase.rpc(
-                    "increment_model_pattern_counters",
-                    {
-                        "p_task_context": task_context,
-                        "p_model_used": model_used,
-                        "p_is_success": outcome == PatternOutcome.SUCCESS,
-                        "p_is_failure": outcome == PatternOutcome.FAILURE,
-                        "p_cost": total_cost_usd,
-                        "p_latency": total_latency_ms
-                    }
-                ).execute()
-                return pattern_id
-
-            return None
+            self._pattern_cache.invalidate(task_context)
+            return result.data or None
 
         return "file-based"
 
@@ -920,16 +1922,22 @@ class KnowledgeRepository:
         if not self.supabase:
             return None
 
-        result = self.supabase.table("arcus_model_patterns") \
-            .select("*") \
-            .eq("task_context", task_context) \
-            .gte("usage_count", min_usage) \
-            .gte("success_rate", min_success_rate) \
-            .order("success_rate", desc=True) \
-            .limit(1) \
-            .execute()
+        cache_key = (task_context, min_usage, min_success_rate)
+        rows = self._pattern_cache.get(cache_key)
+        if rows is None:
+            result = self.supabase.table("arcus_model_patterns") \
+                .select("*") \
+                .eq("task_context", task_context) \
+                .gte("usage_count", min_usage) \
+                .gte("success_rate", min_success_rate) \
+                .order("success_rate", desc=True) \
+                .limit(1) \
+                .execute()
+            # Cache the (possibly empty) row list so misses are cached too
+            rows = result.data or []
+            self._pattern_cache.set(cache_key, rows)
 
-        return result.data[0] if result.data else None
+        return rows[0] if rows else None
 
     def get_user_preference_vector(
         self,
@@ -950,26 +1958,32 @@ class KnowledgeRepository:
             # Return default
             return UserPreferenceVectorEntry(context_name="default")
 
-        result = self.supabase.table("arcus_user_preference_vectors") \
-            .select("*") \
-            .eq("user_id", user_id) \
-            .eq("context_name", context_name) \
-            .eq("is_active", True) \
-            .limit(1) \
-            .execute()
+        cache_key = (user_id, context_name)
+        rows = self._preference_cache.get(cache_key)
+        if rows is None:
+            result = self.supabase.table("arcus_user_preference_vectors") \
+                .select("*") \
+                .eq("user_id", user_id) \
+                .eq("context_name", context_name) \
+                .eq("is_active", True) \
+                .limit(1) \
+                .execute()
+            rows = result.data or []
+            self._preference_cache.set(cache_key, rows)
 
-        if result.data:
-            data = result.data[0]
+        if rows:
+            data = rows[0]
+            # Copy the maps so callers can't mutate the cached row
             return UserPreferenceVectorEntry(
                 user_id=data.get("user_id", "default"),
                 context_name=data.get("context_name", "default"),
                 accuracy_weight=data.get("accuracy_weight", 0.5),
                 cost_weight=data.get("cost_weight", 0.3),
                 latency_weight=data.get("latency_weight", 0.2),
-                model_preferences=data.get("model_preferences"),
-                tool_preferences=data.get("tool_preferences"),
-                skill_preferences=data.get("skill_preferences"),
-                overrides=data.get("overrides")
+                model_preferences=dict(data.get("model_preferences") or {}),
+                tool_preferences=dict(data.get("tool_preferences") or {}),
+                skill_preferences=dict(data.get("skill_preferences") or {}),
+                overrides=dict(data.get("overrides") or {})
             )
 
         return UserPreferenceVectorEntry(context_name=context_name, user_id=user_id)
@@ -1000,64 +2014,21 @@ class KnowledgeRepository:
         if not self.supabase:
             return False
 
-        # Get current preferences
-        result = self.supabase.table("arcus_user_preference_vectors") \
-            .select("*") \
-            .eq("user_id", user_id) \
-            .eq("context_name", context_name) \
-            .eq("is_active", True) \
-            .limit(1) \
-            .execute()
-
-        if not result.data:
-            # Create new preference vector
-            new_prefs = UserPreferenceVectorEntry(
-                context_name=context_name,
-                user_id=user_id,
-                source=KnowledgeSource(type=SourceType.USER_IMPLICIT)
-            )
-            self.supabase.table("arcus_user_preference_vectors") \
-                .insert(new_prefs.to_dict()) \
-                .execute()
-            result = self.supabase.table("arcus_user_preference_vectors") \
-                .select("*") \
-                .eq("user_id", user_id) \
-                .eq("context_name", context_name) \
-                .eq("is_active", True) \
-                .limit(1) \
-                .execute()
-
-        if result.data:
-            data = result.data[0]
-            update_data = {
-                "feedback_count": data.get("feedback_count", 0) + 1,
-                "last_feedback": datetime.utcnow().isoformat()
+        # Create-if-missing and weight adjustment happen in one atomic RPC
+        result = self.supabase.rpc(
+            "update_preference_from_feedback",
+            {
+                "p_user_id": user_id,
+                "p_context": context_name,
+                "p_model": model_used,
+                "p_tool": tool_used,
+                "p_positive": positive,
+                "p_source": KnowledgeSource.get(type=SourceType.USER_IMPLICIT).to_dict()
             }
+        ).execute()
+        self._preference_cache.discard((user_id, context_name))
 
-            # Adjust model preference
-            if model_used:
-                model_prefs = data.get("model_preferences", {})
-                current = model_prefs.get(model_used, 0.5)
-                delta = 0.05 if positive else -0.05
-                model_prefs[model_used] = max(0.1, min(0.95, current + delta))
-                update_data["model_preferences"] = model_prefs
-
-            # Adjust tool preference
-            if tool_used:
-                tool_prefs = data.get("tool_preferences", {})
-                current = tool_prefs.get(tool_used, 0.5)
-                delta = 0.05 if positive else -0.05
-                tool_prefs[tool_used] = max(0.1, min(0.95, current + delta))
-                update_data["tool_preferences"] = tool_prefs
-
-            self.supabase.table("arcus_user_preference_vectors") \
-                .update(update_data) \
-                .eq("id", data["id"]) \
-                .execute()
-
-            return True
-
-        return False
+        return bool(result.data)
 
     def compute_efficiency_score(
         self,
@@ -1099,19 +2070,46 @@ class KnowledgeRepository:
                 max_latency=max_latency
             )
 
-        # Default weights
-        accuracy_weight = 0.5
-        cost_weight = 0.3
-        latency_weight = 0.2
+        # Default weights: accuracy 0.5, cost 0.3, latency 0.2
+        return _weighted_score(
+            1.0, cost_usd, latency_ms,
+            0.5, 0.3, 0.2,
+            max_cost, max_latency
+        )
 
-        cost_normalized = 1.0 - min(cost_usd / max_cost, 1.0)
-        latency_normalized = 1.0 - min(latency_ms / max_latency, 1.0)
+    def compute_efficiency_scores(
+        self,
+        successes: Sequence[bool],
+        costs_usd: Sequence[float],
+        latencies_ms: Sequence[float],
+        preference_vector: Optional[UserPreferenceVectorEntry] = None,
+        max_cost: float = 0.10,
+        max_latency: float = 30000.0
+    ) -> List[float]:
+        """
+        Compute efficiency scores for many actions at once.
 
-        return (
-            1.0 * accuracy_weight +
-            cost_normalized * cost_weight +
-            latency_normalized * latency_weight
+        Equivalent to calling compute_efficiency_score() per action, but the
+        weights are resolved once and scored through the batch kernel.
+
+        Args:
+            successes: Whether each action succeeded
+            costs_usd: Cost in USD per action
+            latencies_ms: Latency in milliseconds per action
+            preference_vector: User preferences (default weights if None)
+            max_cost: Max cost for normalization
+            max_latency: Max latency for normalization
+
+        Returns:
+            Efficiency scores (0-1) in action order
+        """
+        # Default weights: accuracy 0.5, cost 0.3, latency 0.2
+        vector = preference_vector or UserPreferenceVectorEntry(context_name="default")
+        scores = vector.compute_scores(
+            [1.0] * len(costs_usd), costs_usd, latencies_ms,
+            max_cost=max_cost, max_latency=max_latency
         )
+        return [score if success else 0.0 for success, score in zip(successes, scores)]
 
     def get_efficiency_report(self, days: int = 30) -> Dict[str, Any]:
         """
@@ -1126,46 +2124,23 @@ class KnowledgeRepository:
         if not self.supabase:
             return {"error": "Supabase not connected"}
 
-        cutoff = (datetime.utcnow() - timedelta(days=days)).isoformat()
+        now = datetime.utcnow()
+        cutoff = (now - timedelta(days=days)).isoformat()
+        period = {"start": cutoff, "end": now.isoformat()}
 
-        result = self.supabase.table("arcus_autonomy_audit") \
-            .select("*") \
-            .gte("executed_at", cutoff) \
-            .not_.is_("model_used", "null") \
-            .execute()
+        model_stats = self._fetch_model_stats(cutoff)
 
-        if not result.data:
+        if not model_stats:
             return {
-                "period": {"start": cutoff, "end": datetime.utcnow().isoformat()},
+                "period": period,
                 "total_requests": 0,
                 "message": "No data available"
             }
 
-        # Aggregate by model
-        model_stats: Dict[str, Dict] = {}
-        total_cost = 0.0
-        total_tokens = 0
-        total_latency = 0
-
-        for entry in result.data:
-            model = entry.get("model_used", "unknown")
-            if model not in model_stats:
-                model_stats[model] = {
-                    "count": 0,
-                    "cost": 0.0,
-                    "success": 0,
-                    "latency": 0
-                }
-
-            model_stats[model]["count"] += 1
-            model_stats[model]["cost"] += entry.get("estimated_cost_usd", 0) or 0
-            model_stats[model]["latency"] += entry.get("latency_ms", 0) or 0
-            if entry.get("outcome") == "success":
-                model_stats[model]["success"] += 1
-
-            total_cost += entry.get("estimated_cost_usd", 0) or 0
-            total_tokens += (entry.get("tokens_input", 0) or 0) + (entry.get("tokens_output", 0) or 0)
-            total_latency += entry.get("latency_ms", 0) or 0
+        total_requests = sum(stats["count"] for stats in model_stats.values())
+        total_cost = sum(stats["cost"] for stats in model_stats.values())
+        total_tokens = sum(stats["tokens"] for stats in model_stats.values())
+        total_latency = sum(stats["latency"] for stats in model_stats.values())
 
         # Compute averages and success rates
         model_breakdown = {}
@@ -1186,23 +2161,79 @@ class KnowledgeRepository:
                 recommendations.append(f"{model} has high latency ({stats['avg_latency_ms']}ms avg) - consider using faster model for time-sensitive tasks")
 
         # Check for over-reliance on expensive models
-        total_count = sum(s["count"] for s in model_breakdown.values())
         for model in ["claude-opus", "gemini-3-pro"]:
             if model in model_breakdown:
-                pct = model_breakdown[model]["count"] / total_count
+                pct = model_breakdown[model]["count"] / total_requests
                 if pct > 0.5:
                     recommendations.append(f"High usage of {model} ({pct:.0%}) - consider using cheaper models for simpler tasks")
 
         return {
-            "period": {"start": cutoff, "end": datetime.utcnow().isoformat()},
-            "total_requests": len(result.data),
+            "period": period,
+            "total_requests": total_requests,
             "total_cost_usd": round(total_cost, 6),
             "total_tokens": total_tokens,
-            "avg_latency_ms": round(total_latency / len(result.data)) if result.data else 0,
+            "avg_latency_ms": round(total_latency / total_requests) if total_requests else 0,
             "model_breakdown": model_breakdown,
             "recommendations": recommendations
         }
 
+    async def get_efficiency_report_async(self, days: int = 30) -> Dict[str, Any]:
+        """Async variant of get_efficiency_report() (runs in a worker thread)."""
+        return await asyncio.to_thread(self.get_efficiency_report, days)
+
+    def _fetch_model_stats(self, cutoff: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Per-model audit aggregates since cutoff via the efficiency_report RPC.
+
+        Returns:
+            {model: {"count", "cost", "success", "latency", "tokens"}}
+        """
+        try:
+            result = self.supabase.rpc("efficiency_report", {"p_cutoff": cutoff}).execute()
+            return {
+                row["model_used"]: {
+                    "count": row["request_count"],
+                    "cost": float(row["total_cost"] or 0),
+                    "success": row["success_count"],
+                    "latency": row["total_latency_ms"] or 0,
+                    "tokens": row["total_tokens"] or 0,
+                }
+                for row in (result.data or [])
+            }
+        except Exception as e:
+            # RPC not deployed yet: aggregate the audit rows client-side
+            logger.warning("efficiency_report unavailable (%s), aggregating client-side", e)
+
+        rows = self._iter_table(
+            "arcus_autonomy_audit",
+            [("gte", "executed_at", cutoff), ("not_.is_", "model_used", "null")],
+            columns=EFFICIENCY_COLUMNS,
+            page=1000,
+            order_by="executed_at",
+        )
+
+        model_stats: Dict[str, Dict[str, Any]] = {}
+        for entry in rows:
+            model = entry.get("model_used", "unknown")
+            stats = model_stats.get(model)
+            if stats is None:
+                stats = model_stats[model] = {
+                    "count": 0,
+                    "cost": 0.0,
+                    "success": 0,
+                    "latency": 0,
+                    "tokens": 0
+                }
+
+            stats["count"] += 1
+            stats["cost"] += entry.get("estimated_cost_usd", 0) or 0
+            stats["latency"] += entry.get("latency_ms", 0) or 0
+            stats["tokens"] += (entry.get("tokens_input", 0) or 0) + (entry.get("tokens_output", 0) or 0)
+            if entry.get("outcome") == "success":
+                stats["success"] += 1
+
+        return model_stats
+
     # =========================================================================
     # UTILITY METHODS
     # =========================================================================
@@ -1211,69 +2242,282 @@ class KnowledgeRepository:
         """
         Flush pending batch operations to storage.
 
+        Items are already bucketed by memory type and written with one
+        multi-row insert per table (or a single file write in file-only mode).
+
         Returns:
             Number of items flushed
         """
-        if not self._pending_queue:
-            return 0
+        # One flush at a time, so batches reach storage in queue order
+        with self._flush_lock:
+            with self._pending_lock:
+                if self._flush_timer is not None:
+                    self._flush_timer.cancel()
+                    self._flush_timer = None
+                pending, self._pending = self._pending, defaultdict(list)
+
+            count = sum(map(len, pending.values()))
+            if not count:
+                return 0
 
-        count = len(self._pending_queue)
+            try:
+                if self.supabase:
+                    for memory_type, rows in list(pending.items()):
+                        try:
+                            self._insert_rows(f"arcus_{memory_type}_memory", rows)
+                        except PartialInsertError:
+                            # Committed chunks were trimmed from rows already
+                            self._invalidate_recall_cache(memory_type)
+                            raise
+                        self._invalidate_recall_cache(memory_type)
+                        # Drop flushed rows so a later failure doesn't re-insert them
+                        del pending[memory_type]
+                else:
+                    self._append_many(
+                        [
+                            (memory_type, data)
+                            for memory_type, rows in pending.items()
+                            for data in rows
+                        ],
+                        now=_utc_timestamp()
+                    )
+                    pending.clear()
+            except Exception:
+                self._requeue(pending)
+                raise
+            return count
+
+    def _requeue(self, pending: Dict[str, List[Dict[str, Any]]]) -> None:
+        """Put unflushed rows back ahead of anything queued since the swap."""
+        with self._pending_lock:
+            for memory_type, rows in pending.items():
+                self._pending[memory_type][:0] = rows
+
+    def _schedule_flush(self) -> None:
+        """Start the background flush timer if one isn't running (caller holds the lock)."""
+        if self._flush_interval is None or self._flush_timer is not None:
+            return
+        timer = threading.Timer(self._flush_interval, self._timed_flush)
+        timer.daemon = True
+        self._flush_timer = timer
+        timer.start()
+
+    def _timed_flush(self) -> None:
+        """Background flush; failed entries stay queued for the next attempt."""
+        try:
+            self.flush_pending()
+        except Exception as e:
+            logger.warning(f"Background flush failed, will retry: {e}")
+            with self._pending_lock:
+                self._flush_timer = None
+                if self.pending_count:
+                    self._schedule_flush()
+
+    @property
+    def pending_count(self) -> int:
+        """Number of batched entries waiting for flush_pending()."""
+        return sum(map(len, self._pending.values()))
+
+    def _insert_rows(self, table: str, rows: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Multi-row insert, split into INSERT_CHUNK_SIZE requests to stay under payload limits.
 
-        for item in self._pending_queue:
-            memory_type = MemoryType(item["type"])
-            if self.supabase:
-                table = f"arcus_{memory_type.value}_memory"
-                self.supabase.table(table).insert(item["data"]).execute()
-            else:
-                self._append_to_memory_file(memory_type.value, item["data"])
+        Each chunk commits on its own. If a later chunk fails, the committed
+        prefix is removed from ``rows`` (so the list holds only what still
+        needs writing) and PartialInsertError reports how many were stored.
+        """
+        inserted: List[Dict[str, Any]] = []
+        for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+            try:
+                result = self.supabase.table(table).insert(rows[start:start + INSERT_CHUNK_SIZE]).execute()
+            except Exception as e:
+                if not start:
+                    raise
+                del rows[:start]
+                raise PartialInsertError(start, e) from e
+            inserted.extend(result.data or [])
+        return inserted
+
+    def _append_to_memory_file(
+        self,
+        memory_type: str,
+        data: Dict[str, Any],
+        now: Optional[str] = None
+    ) -> None:
+        """Append an entry to the memory file (fallback storage)."""
+        self._append_many([(memory_type, data)], now=now)
 
-        self._pending_queue = []
-        return count
+    def _append_many(
+        self,
+        entries: List[Tuple[str, Dict[str, Any]]],
+        now: Optional[str] = None
+    ) -> None:
+        """
+        Append several entries to the memory file with a single write.
+
+        The file is opened once and the handle reused across calls; entries
+        are only appended to a memory file that already exists. All entries
+        share one timestamp; pass ``now`` (ISO format) to reuse one computed
+        by the caller.
+        """
+        timestamp = now or _utc_timestamp()
 
-    def _append_to_memory_file(self, memory_type: str, data: Dict[str, Any]) -> None:
-        """Append an entry to the memory file (fallback storage)."""
         # This is a simplified file-based storage
-        timestamp = datetime.utcnow().isoformat()
-        entry = f"\n| {timestamp} | {memory_type} | {data.get('summary', data.get('statement', data.get('name', 'unknown')))} | {data.get('confidence', 0.8)} |"
+        payload = "".join([
+            _MEMORY_ROW_FMT(
+                timestamp, memory_type, _cell_escape(_summary_of(data)), data.get("confidence", 0.8)
+            )
+            for memory_type, data in entries
+        ])
+
+        with self._memory_lock:
+            if self._memory_handle is None:
+                if not os.path.exists(self.memory_file):
+                    return
+                self._memory_handle = open(self.memory_file, "a", buffering=65536)
+            self._memory_handle.write(payload)
+            self._memory_handle.flush()
+
+    def close(self) -> None:
+        """Release the memory file handle and the query thread pool."""
+        with self._memory_lock:
+            if self._memory_handle is not None:
+                self._memory_handle.close()
+                self._memory_handle = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _recall_from_file(
+        self,
+        query: str,
+        memory_type: str,
+        limit: int = 10,
+        min_confidence: float = 0.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Recall from file-based storage via the memory-file inverted index.
+
+        Only rows sharing at least one token with the query are scored (by
+        number of shared tokens, newest first on ties). An empty query
+        returns the most recent rows.
+        """
+        with self._file_index_lock:
+            self._refresh_file_index()
+            entries = self._file_entries
+            tokens = set(_TOKEN_RE.findall(query.lower()))
+
+            if tokens:
+                scores: Counter = Counter()
+                for token in tokens:
+                    for position in self._file_index.get(token, ()):
+                        scores[position] += 1
+                candidates = sorted(scores, key=lambda pos: (scores[pos], pos), reverse=True)
+            else:
+                candidates = range(len(entries) - 1, -1, -1)
+
+            results = []
+            for position in candidates:
+                entry = entries[position]
+                if entry["memory_type"] != memory_type or entry["confidence"] < min_confidence:
+                    continue
+                results.append(dict(entry))
+                if len(results) >= limit:
+                    break
+            return results
+
+    def _refresh_file_index(self) -> None:
+        """Re-parse the memory file into the inverted index if it changed (caller holds the lock)."""
+        try:
+            stat = os.stat(self.memory_file)
+        except OSError:
+            self._file_entries, self._file_index, self._file_stamp = [], {}, None
+            return
+
+        stamp = (stat.st_mtime, stat.st_size)
+        if stamp == self._file_stamp:
+            return
 
-        if os.path.exists(self.memory_file):
-            with open(self.memory_file, "a") as f:
-                f.write(entry)
+        entries: List[Dict[str, Any]] = []
+        index: Dict[str, Set[int]] = defaultdict(set)
+        with open(self.memory_file, encoding="utf-8", errors="replace") as f:
+            for line in f:
+                match = _MEMORY_ROW_RE.match(line.strip())
+                if not match:
+                    continue
+                timestamp, memory_type, text, confidence = match.groups()
+                text = _cell_unescape(text)
+                position = len(entries)
+                entries.append({
+                    "memory_type": memory_type,
+                    _FILE_TEXT_FIELDS[memory_type]: text,
+                    "confidence": float(confidence),
+                    "created_at": timestamp,
+                })
+                for token in set(_TOKEN_RE.findall(text.lower())):
+                    index[token].add(position)
 
-    def _recall_from_file(self, query: str, memory_type: str) -> List[Dict[str, Any]]:
-        """Recall from file-based storage (simplified)."""
-        # In a real implementation, this would parse the memory file
-        return []
+        self._file_entries, self._file_index, self._file_stamp = entries, dict(index), stamp
 
     def get_stats(self) -> Dict[str, Any]:
         """Get repository statistics."""
         stats = {
-            "pending_queue_size": len(self._pending_queue),
+            "pending_queue_size": self.pending_count,
             "supabase_connected": self.supabase is not None,
             "memory_file": self.memory_file,
             "memory_file_exists": os.path.exists(self.memory_file)
         }
 
         if self.supabase:
-            # Get counts from each table
-            for table in ["episodic", "semantic", "procedural"]:
-                result = self.supabase.table(f"arcus_{table}_memory") \
-                    .select("id", count="exact") \
-                    .execute()
-                stats[f"{table}_count"] = result.count if result.count else 0
+            # Get counts from each table: HEAD requests (count header only),
+            # issued concurrently for tables without a cached count
+            tables = ["episodic", "semantic", "procedural"]
+            counts = {table: self._recall_cache.get((table, "count")) for table in tables}
+            missing = [table for table, count in counts.items() if count is None]
+            for table, count in zip(missing, self._get_executor().map(self._count_rows, missing)):
+                counts[table] = count
+            for table in tables:
+                stats[f"{table}_count"] = counts[table]
 
         return stats
 
+    def _count_rows(self, memory_type: str) -> int:
+        """Exact row count of a memory table without fetching any rows."""
+        result = self.supabase.table(f"arcus_{memory_type}_memory") \
+            .select("id", count="exact", head=True) \
+            .execute()
+        count = result.count if result.count else 0
+        # Cached alongside recall results so writes to the table invalidate it
+        self._recall_cache.set((memory_type, "count"), count)
+        return count
+
 
 # =============================================================================
 # CONVENIENCE FUNCTIONS
 # =============================================================================
 
+@functools.lru_cache(maxsize=1)
 def create_repository() -> KnowledgeRepository:
-    """Create a repository instance using environment variables."""
+    """
+    Get the shared repository instance configured from environment variables.
+
+    The instance (and its Supabase client/connection pool) is created once
+    and reused. Construct KnowledgeRepository(...) directly for a fresh one.
+    """
     return KnowledgeRepository()
 
 
+def reset_repository() -> None:
+    """
+    Drop the shared repository and Supabase clients.
+
+    The next create_repository() call re-reads the environment, e.g. after
+    credentials change or between test cases.
+    """
+    create_repository.cache_clear()
+    _shared_supabase_client.cache_clear()
+
+
 def learn_from_correction(correction: str, context: Optional[str] = None) -> Optional[str]:
     """
     Quick function to learn from a user correction.
@@ -1332,7 +2576,7 @@ if __name__ == "__main__":
 
     # Show stats
     stats = repo.get_stats()
-    print(f"Repository Stats: {json.dumps(stats, indent=2)}")
+    print(f"Repository Stats: {dumps_json(stats, indent=True)}")
 
     # Example: Learn a preference
     print("\nLearning a preference...")
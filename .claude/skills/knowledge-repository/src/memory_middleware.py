@@ -31,17 +31,25 @@ Usage (standalone gateway mode):
 """
 
 import asyncio
+import atexit
+import functools
 import json
 import logging
 import os
 import re
-from dataclasses import dataclass, field
+import threading
+import time
+import weakref
+from collections import defaultdict, deque
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 from knowledge_operations import (
     KnowledgeRepository,
+    MemoryType,
+    PartialInsertError,
     SemanticCategory,
     SemanticEntry,
     EpisodicEntry,
@@ -55,8 +63,47 @@ from context_budget import ContextBudgetManager
 from trust_engine import TrustEngine, ActionCategory
 from model_router import ModelRouter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 logger = logging.getLogger("arcus.middleware")
 
+# Audit entries buffered before a write, the longest one waits on disk,
+# and the most held in memory before the oldest are dropped
+AUDIT_FLUSH_THRESHOLD = 64
+AUDIT_FLUSH_INTERVAL_SECONDS = 1.0
+AUDIT_MAX_BUFFERED = 10_000
+
+# (millisecond, ISO string) of the last formatted audit timestamp; replaced
+# as one tuple so concurrent loggers never see a mismatched pair
+_last_ts: Tuple[int, str] = (0, "")
+
+
+def _fast_iso_now() -> str:
+    """Current UTC time in ISO format, formatted at most once per millisecond."""
+    global _last_ts
+    now_ns = time.time_ns()
+    cached_ms, cached = _last_ts
+    if now_ns // 1_000_000 == cached_ms:
+        return cached
+    formatted = datetime.fromtimestamp(now_ns / 1e9, timezone.utc).isoformat()
+    _last_ts = (now_ns // 1_000_000, formatted)
+    return formatted
+
+
+def _audit_line(entry: Dict[str, Any]) -> bytes:
+    """Serialize one audit record as a JSON line (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(entry, default=str, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry, default=str) + "\n").encode()
+
 
 # =============================================================================
 # AUDIT LOGGER
@@ -67,7 +114,9 @@ class AuditLogger:
     Structured audit logger for gateway events.
 
     Writes JSON-lines to a dedicated audit log file. Each entry includes
-    timestamp, event type, user, channel, and event-specific data.
+    timestamp, event type, user, channel, and event-specific data. Entries
+    are queued in memory and written in batches by a background thread;
+    call flush() (or close()) before shutdown.
 
     The audit log captures:
     - Session start/end
@@ -78,16 +127,44 @@ class AuditLogger:
     - Trust level changes
     """
 
-    def __init__(self, log_dir: str = "", enabled: bool = True):
+    def __init__(
+        self,
+        log_dir: str = "",
+        enabled: bool = True,
+        flush_threshold: int = AUDIT_FLUSH_THRESHOLD,
+        flush_interval: float = AUDIT_FLUSH_INTERVAL_SECONDS,
+        max_buffered: int = AUDIT_MAX_BUFFERED,
+    ):
         self.enabled = enabled
         if not log_dir:
             log_dir = os.getenv("ARCUS_AUDIT_LOG_DIR", "logs")
         self._log_dir = Path(log_dir)
         self._log_file: Optional[Path] = None
 
+        # Lines are buffered and handed to a background writer thread, so
+        # the message path never waits on disk. The buffer is bounded: when
+        # the writer falls behind, the oldest entries are dropped. Batches go
+        # out through a raw O_APPEND descriptor, one write() per batch, so
+        # lines from concurrent workers never interleave mid-line.
+        self._flush_threshold = flush_threshold
+        self._flush_interval = flush_interval
+        self._buf: Deque[bytes] = deque(maxlen=max_buffered)
+        self._dropped = 0
+        self._dropped_reported = 0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._fd: Optional[int] = None
+        self._wake = threading.Event()
+        self._writer: Optional[threading.Thread] = None
+        self._closed = False
+
         if self.enabled:
             self._log_dir.mkdir(parents=True, exist_ok=True)
             self._log_file = self._log_dir / "audit.jsonl"
+            # Closed at exit by _close_audit_loggers(); tracked weakly so an
+            # abandoned logger (and its writer thread) can still be collected
+            _LIVE_AUDIT_LOGGERS.add(self)
+            weakref.finalize(self, self._wake.set)
 
     def log(
         self,
@@ -96,37 +173,156 @@ class AuditLogger:
         channel: str = "",
         **data: Any,
     ) -> None:
-        """Write an audit entry."""
-        if not self.enabled or not self._log_file:
+        """Queue an audit entry for the background writer."""
+        self.log_with_base({"user": user_id, "channel": channel}, event_type, **data)
+
+    def log_with_base(self, base: Dict[str, Any], event_type: str, **data: Any) -> None:
+        """
+        Queue an audit entry built from a prebuilt base ({"user", "channel"}).
+
+        Sessions keep their base in MiddlewareSession.audit_base, so the
+        per-message helpers don't rebuild it for every event.
+        """
+        if not self.enabled or not self._log_file or self._closed:
             return
 
-        entry = {
-            "ts": datetime.now(timezone.utc).isoformat(),
-            "event": event_type,
-            "user": user_id,
-            "channel": channel,
-            **data,
+        line = _audit_line({"ts": _fast_iso_now(), "event": event_type, **base, **data})
+
+        with self._lock:
+            if len(self._buf) == self._buf.maxlen:
+                self._dropped += 1
+            self._buf.append(line)
+            pending = len(self._buf)
+            if self._writer is None:
+                self._writer = threading.Thread(
+                    target=self._writer_loop,
+                    args=(weakref.ref(self), self._wake),
+                    name="arcus-audit",
+                    daemon=True,
+                )
+                self._writer.start()
+
+        # Wake the writer on the first entry of a batch and again once the
+        # batch is full; in between it waits up to flush_interval
+        if pending == 1 or pending >= self._flush_threshold:
+            self._wake.set()
+
+    @property
+    def dropped(self) -> int:
+        """Number of entries dropped because the buffer was full."""
+        return self._dropped
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Audit logger counters (buffered entries and overflow drops)."""
+        return {
+            "enabled": self.enabled,
+            "buffered": len(self._buf),
+            "dropped": self._dropped,
         }
 
-        try:
-            with open(self._log_file, "a") as f:
-                f.write(json.dumps(entry, default=str) + "\n")
-        except Exception as e:
-            logger.debug(f"Audit log write failed: {e}")
+    def flush(self) -> None:
+        """Write any buffered entries to the audit file."""
+        with self._write_lock:
+            with self._lock:
+                lines = list(self._buf)
+                self._buf.clear()
+                dropped = self._dropped - self._dropped_reported
+                self._dropped_reported = self._dropped
+            if dropped:
+                logger.warning(
+                    f"Audit buffer full: dropped {dropped} entries "
+                    f"({self._dropped} since start)"
+                )
+            if not lines:
+                return
+            try:
+                if self._fd is None:
+                    self._fd = os.open(
+                        str(self._log_file), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+                    )
+                self._write_all(b"".join(lines))
+            except Exception as e:
+                logger.debug(f"Audit log write failed: {e}")
 
-    def log_message(self, user_id: str, channel: str, text_length: int, response_length: int) -> None:
+    def _write_all(self, payload: bytes) -> None:
+        """Append payload with as few write() calls as the kernel allows."""
+        view = memoryview(payload)
+        while view:
+            try:
+                written = os.write(self._fd, view)
+            except InterruptedError:
+                continue
+            view = view[written:]
+
+    def close(self) -> None:
+        """Stop the writer, flush buffered entries and close the audit file."""
+        _LIVE_AUDIT_LOGGERS.discard(self)
+        self._closed = True
+        self._wake.set()
+        writer = self._writer
+        if writer is not None and writer is not threading.current_thread():
+            writer.join(timeout=self._flush_interval + 1.0)
+        self.flush()
+        with self._write_lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    @staticmethod
+    def _writer_loop(ref: "weakref.ReferenceType[AuditLogger]", wake: threading.Event) -> None:
+        """
+        Background writer: gather a batch, then write it in one go.
+
+        Holds the logger only by weak reference between batches; if the
+        logger is collected, its finalizer sets ``wake`` and the loop exits.
+        """
+        while True:
+            wake.wait()
+            wake.clear()
+            audit = ref()
+            if audit is None or audit._closed:
+                return
+            full = len(audit._buf) >= audit._flush_threshold
+            interval = audit._flush_interval
+            del audit
+            if not full:
+                wake.wait(interval)
+                wake.clear()
+            audit = ref()
+            if audit is None:
+                return
+            audit.flush()
+            if audit._closed:
+                return
+            del audit
+
+    def log_message(
+        self,
+        user_id: str,
+        channel: str,
+        text_length: int,
+        response_length: int,
+        base: Optional[Dict[str, Any]] = None,
+    ) -> None:
         """Log a message exchange (lengths only, not content)."""
-        self.log("message", user_id=user_id, channel=channel,
-                 text_len=text_length, response_len=response_length)
+        self.log_with_base(base or {"user": user_id, "channel": channel}, "message",
+                           text_len=text_length, response_len=response_length)
 
     def log_command(self, user_id: str, channel: str, command: str) -> None:
         """Log a slash command execution."""
         self.log("command", user_id=user_id, channel=channel, command=command)
 
-    def log_learning(self, user_id: str, channel: str, learning_type: str, source: str) -> None:
+    def log_learning(
+        self,
+        user_id: str,
+        channel: str,
+        learning_type: str,
+        source: str,
+        base: Optional[Dict[str, Any]] = None,
+    ) -> None:
         """Log a captured learning."""
-        self.log("learning", user_id=user_id, channel=channel,
-                 learning_type=learning_type, source=source)
+        self.log_with_base(base or {"user": user_id, "channel": channel}, "learning",
+                           learning_type=learning_type, source=source)
 
     def log_session(self, event: str, user_id: str, channel: str, message_count: int = 0) -> None:
         """Log session start/end."""
@@ -138,11 +334,24 @@ class AuditLogger:
         self.log("auth_failure", user_id=user_id, channel=channel, reason=reason)
 
 
+# Audit loggers not yet closed; one atexit hook flushes them all
+_LIVE_AUDIT_LOGGERS: "weakref.WeakSet[AuditLogger]" = weakref.WeakSet()
+
+
+def _close_audit_loggers() -> None:
+    """Flush and close every live audit logger (registered with atexit)."""
+    for audit in list(_LIVE_AUDIT_LOGGERS):
+        audit.close()
+
+
+atexit.register(_close_audit_loggers)
+
+
 # =============================================================================
 # CONFIGURATION
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class MiddlewareConfig:
     """Configuration for the memory middleware."""
     # Database
@@ -175,26 +384,56 @@ class MiddlewareConfig:
 
     @classmethod
     def from_env(cls) -> "MiddlewareConfig":
+        """
+        Config from environment variables.
+
+        The environment is parsed once per process; each call returns a copy
+        so callers can adjust their own config (e.g. /verbose) independently.
+        Use reload_from_env() after changing the environment.
+        """
+        global _CONFIG_CACHE
+        if _CONFIG_CACHE is None:
+            _CONFIG_CACHE = cls._parse_env()
+        return replace(_CONFIG_CACHE)
+
+    @classmethod
+    def reload_from_env(cls) -> "MiddlewareConfig":
+        """Re-read the environment, replacing the cached config."""
+        global _CONFIG_CACHE
+        _CONFIG_CACHE = cls._parse_env()
+        return replace(_CONFIG_CACHE)
+
+    @classmethod
+    def _parse_env(cls) -> "MiddlewareConfig":
         return cls(
             supabase_url=os.getenv("SUPABASE_URL", ""),
             supabase_key=os.getenv("SUPABASE_SERVICE_ROLE_KEY", ""),
-            memory_injection_enabled=os.getenv("ARCUS_MEMORY_INJECTION", "true").lower() == "true",
+            memory_injection_enabled=_env_bool("ARCUS_MEMORY_INJECTION"),
             max_context_tokens=int(os.getenv("ARCUS_MAX_CONTEXT_TOKENS", "8000")),
-            auto_learn_enabled=os.getenv("ARCUS_AUTO_LEARN", "true").lower() == "true",
-            trust_tracking_enabled=os.getenv("ARCUS_TRUST_TRACKING", "true").lower() == "true",
+            auto_learn_enabled=_env_bool("ARCUS_AUTO_LEARN"),
+            trust_tracking_enabled=_env_bool("ARCUS_TRUST_TRACKING"),
             heartbeat_interval_messages=int(os.getenv("ARCUS_HEARTBEAT_INTERVAL", "50")),
             max_history_turns=int(os.getenv("ARCUS_MAX_HISTORY_TURNS", "10")),
             verbosity_level=int(os.getenv("ARCUS_VERBOSITY", "1")),
-            audit_enabled=os.getenv("ARCUS_AUDIT_LOG", "true").lower() == "true",
+            audit_enabled=_env_bool("ARCUS_AUDIT_LOG"),
             audit_log_dir=os.getenv("ARCUS_AUDIT_LOG_DIR", "logs"),
         )
 
 
+# Parsed MiddlewareConfig.from_env() result (None until first use)
+_CONFIG_CACHE: Optional[MiddlewareConfig] = None
+
+
+def _env_bool(name: str, default: bool = True) -> bool:
+    """Read a "true"/"false" environment flag."""
+    return os.getenv(name, "true" if default else "false").lower() == "true"
+
+
 # =============================================================================
 # SESSION WITH CONVERSATION HISTORY
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True)
 class MiddlewareSession:
     """Extended session with conversation history and middleware state."""
     user_id: str = ""
@@ -203,19 +442,25 @@ class MiddlewareSession:
     created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     last_activity: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     message_count: int = 0
-    history: List[Dict[str, str]] = field(default_factory=list)
+    # Bounded to max_turns * 2 messages; appends evict the oldest turn in O(1)
+    history: Deque[Dict[str, str]] = field(default_factory=lambda: deque(maxlen=20))
     context: Dict[str, Any] = field(default_factory=dict)
     verbosity_level: int = 1
     memory_injected_at: Optional[datetime] = None
     pending_learnings: List[Dict[str, Any]] = field(default_factory=list)
+    # {"user", "channel"} shared by every audit entry for this session
+    audit_base: Dict[str, str] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.audit_base = {"user": self.user_id, "channel": self.channel}
 
     def add_turn(self, user_message: str, assistant_response: str, max_turns: int = 10) -> None:
         """Add a conversation turn, maintaining max history size."""
+        # Each turn = 2 messages; only rebuild if the limit itself changed
+        if self.history.maxlen != max_turns * 2:
+            self.history = deque(self.history, maxlen=max_turns * 2)
         self.history.append({"role": "user", "content": user_message})
         self.history.append({"role": "assistant", "content": assistant_response})
-        # Trim to max turns (each turn = 2 messages)
-        if len(self.history) > max_turns * 2:
-            self.history = self.history[-(max_turns * 2):]
 
     def touch(self) -> None:
         self.last_activity = datetime.now(timezone.utc)
@@ -228,32 +473,125 @@ class MiddlewareSession:
 
 # Patterns that indicate user is correcting the AI
 _CORRECTION_PATTERNS = [
-    re.compile(r"^(actually|no,?\s)", re.IGNORECASE),
-    re.compile(r"^(that'?s\s+(not|wrong|incorrect))", re.IGNORECASE),
-    re.compile(r"^(i\s+(prefer|want|need|use|like)\s)", re.IGNORECASE),
-    re.compile(r"(don'?t\s+(do|use|say|add)\s)", re.IGNORECASE),
-    re.compile(r"(always|never)\s+(use|do|include|add)", re.IGNORECASE),
-    re.compile(r"(from now on|going forward|in the future)", re.IGNORECASE),
-    re.compile(r"^(please\s+)?(remember|note)\s+that", re.IGNORECASE),
+    r"^(actually|no,?\s)",
+    r"^(that'?s\s+(not|wrong|incorrect))",
+    r"^(i\s+(prefer|want|need|use|like)\s)",
+    r"(don'?t\s+(do|use|say|add)\s)",
+    r"(always|never)\s+(use|do|include|add)",
+    r"(from now on|going forward|in the future)",
+    r"^(please\s+)?(remember|note)\s+that",
 ]
 
 # Patterns that indicate a decision was made
 _DECISION_PATTERNS = [
-    re.compile(r"(let'?s\s+(go with|use|pick|choose))", re.IGNORECASE),
-    re.compile(r"(we'?ll\s+(use|go with|adopt))", re.IGNORECASE),
-    re.compile(r"(decided?\s+to\s)", re.IGNORECASE),
-    re.compile(r"(approved?|confirmed?|agreed?)\b", re.IGNORECASE),
+    r"(let'?s\s+(go with|use|pick|choose))",
+    r"(we'?ll\s+(use|go with|adopt))",
+    r"(decided?\s+to\s)",
+    r"(approved?|confirmed?|agreed?)\b",
 ]
 
 
+def _compile_any(patterns: List[str]) -> "re.Pattern[str]":
+    """Compile patterns into one alternation so a message is scanned once."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), re.IGNORECASE)
+
+
+_CORRECTION_RE = _compile_any(_CORRECTION_PATTERNS)
+_DECISION_RE = _compile_any(_DECISION_PATTERNS)
+
+
+def _compile_hyperscan() -> Optional[Any]:
+    """
+    Compile both pattern groups into one Hyperscan database (None if
+    Hyperscan is not installed or rejects a pattern).
+
+    Correction patterns report match id 0 and decision patterns id 1, so a
+    single scan answers both questions.
+    """
+    if hyperscan is None:
+        return None
+    patterns = _CORRECTION_PATTERNS + _DECISION_PATTERNS
+    flags = (
+        hyperscan.HS_FLAG_CASELESS
+        | hyperscan.HS_FLAG_SINGLEMATCH
+        | hyperscan.HS_FLAG_UTF8
+        | hyperscan.HS_FLAG_UCP
+    )
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[p.encode() for p in patterns],
+            ids=[0] * len(_CORRECTION_PATTERNS) + [1] * len(_DECISION_PATTERNS),
+            elements=len(patterns),
+            flags=[flags] * len(patterns),
+        )
+    except Exception as e:
+        logger.warning(f"Hyperscan unavailable, using re for detection: {e}")
+        return None
+    return db
+
+
+_HS_DB = _compile_hyperscan()
+# A database's scratch space is shared, so scans are serialized
+_HS_LOCK = threading.Lock()
+
+
+def _scan_both(text: str) -> Tuple[bool, bool]:
+    """(is_correction, is_decision) from one pass over text."""
+    if _HS_DB is None:
+        return (
+            _CORRECTION_RE.search(text) is not None,
+            _DECISION_RE.search(text) is not None,
+        )
+
+    found = [False, False]
+
+    def on_match(match_id: int, start: int, end: int, flags: int, context: Any) -> bool:
+        found[match_id] = True
+        return found[0] and found[1]  # stop once both groups matched
+
+    with _HS_LOCK:
+        try:
+            _HS_DB.scan(text.encode("utf-8"), match_event_handler=on_match)
+        except hyperscan.ScanTerminated:
+            pass  # on_match stopped the scan early
+    return found[0], found[1]
+
+
+# Messages shorter than this are memoized (greetings, retries, short replies
+# repeat often); longer ones are scanned directly to keep the caches small
+_DETECT_CACHE_MAX_LEN = 512
+
+
+@functools.lru_cache(maxsize=2048)
+def _detect_both_cached(text: str) -> Tuple[bool, bool]:
+    return _scan_both(text)
+
+
+def detect_both(text: str) -> Tuple[bool, bool]:
+    """
+    Detect corrections and decisions together: (is_correction, is_decision).
+
+    Uses a single Hyperscan pass when Hyperscan is installed.
+    """
+    if len(text) < _DETECT_CACHE_MAX_LEN:
+        return _detect_both_cached(text)
+    return _scan_both(text)
+
+
 def detect_correction(text: str) -> bool:
     """Detect if a message contains a user correction."""
-    return any(p.search(text) for p in _CORRECTION_PATTERNS)
+    return detect_both(text)[0]
 
 
 def detect_decision(text: str) -> bool:
     """Detect if a message contains a decision."""
-    return any(p.search(text) for p in _DECISION_PATTERNS)
+    return detect_both(text)[1]
+
+
+def clear_detector_caches() -> None:
+    """Drop memoized correction/decision results."""
+    _detect_both_cached.cache_clear()
 
 
 # =============================================================================
@@ -337,6 +675,7 @@ class ArcusMiddleware:
                 user_id=user_id,
                 channel=channel,
                 chat_id=chat_id,
+                history=deque(maxlen=self.config.max_history_turns * 2),
                 verbosity_level=self.config.verbosity_level,
             )
             self._sessions[key] = session
@@ -357,37 +696,55 @@ class ArcusMiddleware:
         return session
 
     def _flush_session(self, session: MiddlewareSession) -> None:
-        """Flush pending learnings from a session. Failed learnings are retained."""
+        """
+        Flush pending learnings from a session. Failed learnings are retained.
+
+        Learnings are grouped by memory type and written with one bulk
+        insert per type instead of one request per learning. If a bulk
+        insert fails, that type's learnings are retried one at a time.
+        """
         if not session.pending_learnings:
             return
 
         failed: List[Dict[str, Any]] = []
         flushed = 0
+        batches: Dict[MemoryType, List[Tuple[Dict[str, Any], Any]]] = defaultdict(list)
 
         for learning in session.pending_learnings:
             try:
-                learning_type = learning.get("type", "fact")
-                if learning_type == "preference":
-                    self.knowledge.learn_preference(
-                        learning["content"],
-                        confidence=learning.get("confidence", 0.8),
-                    )
-                elif learning_type == "fact":
-                    self.knowledge.learn_fact(
-                        learning["content"],
-                        category=learning.get("category", "fact"),
-                        confidence=learning.get("confidence", 0.8),
-                    )
-                elif learning_type == "event":
-                    self.knowledge.learn_event(
-                        event_type=learning.get("event_type", "conversation"),
-                        summary=learning["content"],
-                        participants=learning.get("participants", [session.user_id]),
-                    )
-                flushed += 1
+                built = self._learning_entry(learning, session.user_id)
             except Exception as e:
                 logger.error(f"Failed to flush learning: {e}")
                 failed.append(learning)
+                continue
+            if built is None:
+                # Unknown learning type: nothing to store
+                flushed += 1
+                continue
+            memory_type, entry = built
+            batches[memory_type].append((learning, entry))
+
+        for memory_type, items in batches.items():
+            try:
+                self.knowledge.learn_many(memory_type, [entry for _, entry in items])
+                flushed += len(items)
+            except Exception as e:
+                # One bad row fails the whole insert; retry the batch row by
+                # row so only the learnings that fail on their own are kept.
+                # Rows from chunks that were already committed are skipped.
+                committed = e.committed if isinstance(e, PartialInsertError) else 0
+                flushed += committed
+                logger.warning(
+                    f"Bulk flush of {len(items)} {memory_type.value} learnings failed, "
+                    f"retrying {len(items) - committed} individually: {e}"
+                )
+                for learning, entry in items[committed:]:
+                    try:
+                        self.knowledge.learn(memory_type, entry)
+                        flushed += 1
+                    except Exception as e:
+                        logger.error(f"Failed to flush learning: {e}")
+                        failed.append(learning)
 
         session.pending_learnings = failed
         if failed:
@@ -395,6 +752,38 @@ class ArcusMiddleware:
         else:
             logger.info(f"Flushed {flushed} learnings for {session.user_id}")
 
+    @staticmethod
+    def _learning_entry(
+        learning: Dict[str, Any], user_id: str
+    ) -> Optional[Tuple[MemoryType, Any]]:
+        """
+        Build the (memory type, entry) a pending learning is stored as.
+
+        Uses the same builders as learn_preference/learn_fact/learn_event,
+        so batched and single writes store identical rows.
+        """
+        learning_type = learning.get("type", "fact")
+        confidence = learning.get("confidence", 0.8)
+        if learning_type == "preference":
+            return MemoryType.PROCEDURAL, KnowledgeRepository.preference_entry(
+                learning["content"],
+                confidence=confidence,
+            )
+        if learning_type == "fact":
+            return MemoryType.SEMANTIC, KnowledgeRepository.fact_entry(
+                learning["content"],
+                confidence=confidence,
+                category=SemanticCategory(learning.get("category", "fact")),
+            )
+        if learning_type == "event":
+            return MemoryType.EPISODIC, KnowledgeRepository.event_entry(
+                event_type=learning.get("event_type", "conversation"),
+                summary=learning["content"],
+                participants=learning.get("participants", [user_id]),
+                confidence=confidence,
+            )
+        return None
+
     # -------------------------------------------------------------------------
     # PRE-MESSAGE HOOK
     # -------------------------------------------------------------------------
@@ -421,7 +810,7 @@ class ArcusMiddleware:
 
         result: Dict[str, Any] = {
             "system_context": "",
-            "history": session.history,
+            "history": list(session.history),
             "model_recommendation": None,
             "trust_level": 0,
             "session": session,
@@ -458,6 +847,18 @@ class ArcusMiddleware:
 
     async def _build_memory_context(
         self, user_id: str, query: str, session: MiddlewareSession
+    ) -> str:
+        """
+        Build the memory context block off the event loop.
+
+        Recall (blocking Supabase calls) and budget packing run in a worker
+        thread so one message's memory assembly doesn't stall every other
+        inbound message on the loop.
+        """
+        return await asyncio.to_thread(self._build_memory_context_sync, user_id, query, session)
+
+    def _build_memory_context_sync(
+        self, user_id: str, query: str, session: MiddlewareSession
     ) -> str:
         """Build a formatted memory context block using KnowledgeRepository and ContextBudgetManager."""
         parts = []
@@ -544,14 +945,16 @@ class ArcusMiddleware:
         session = self.get_or_create_session(user_id, channel, chat_id)
 
         # Audit log (lengths only — not content, for privacy)
-        self.audit.log_message(user_id, channel, len(user_text), len(ai_response))
+        self.audit.log_message(user_id, channel, len(user_text), len(ai_response),
+                               base=session.audit_base)
 
         # Update conversation history
         session.add_turn(user_text, ai_response, max_turns=self.config.max_history_turns)
 
         # Auto-learn from corrections
         if self.config.auto_learn_enabled and self.config.correction_detection_enabled:
-            if detect_correction(user_text):
+            is_correction, is_decision = detect_both(user_text)
+            if is_correction:
                 session.pending_learnings.append({
                     "type": "preference",
                     "content": user_text,
@@ -559,9 +962,10 @@ class ArcusMiddleware:
                     "source": "auto_correction_detection",
                 })
                 logger.info(f"Auto-captured correction: {user_text[:80]}...")
-                self.audit.log_learning(user_id, channel, "preference", "auto_correction")
+                self.audit.log_learning(user_id, channel, "preference", "auto_correction",
+                                        base=session.audit_base)
 
-            if detect_decision(user_text):
+            if is_decision:
                 session.pending_learnings.append({
                     "type": "event",
                     "event_type": "decision",
@@ -571,7 +975,8 @@ class ArcusMiddleware:
                     "source": "auto_decision_detection",
                 })
                 logger.info(f"Auto-captured decision: {user_text[:80]}...")
-                self.audit.log_learning(user_id, channel, "event", "auto_decision")
+                self.audit.log_learning(user_id, channel, "event", "auto_decision",
+                                        base=session.audit_base)
 
         # Log to Trust Ledger
         if self.config.trust_tracking_enabled:
@@ -730,4 +1135,5 @@ class ArcusMiddleware:
             "trust_tracking": self.config.trust_tracking_enabled,
             "trust_info": trust_info,
             "verbosity_level": self.config.verbosity_level,
+            "audit": self.audit.get_stats(),
         }